@@ -7,7 +7,9 @@ import { getAlgodConfigFromViteEnvironment, getIndexerConfigFromViteEnvironment
 import { VerifiableShuffleClient } from '../contracts/VerifiableShuffle'
 import { getShuffleDeploymentConfigFromViteEnvironment } from '../utils/getShuffleDeploymentConfig'
 import { makeEmptyTransactionSigner } from 'algosdk'
-import { lookupAccountByAddress } from '@algorandfoundation/algokit-utils'
+
+// Mirrors REVEAL_SINGLE_WINNER_OP_COST in the contract's config.py.
+const REVEAL_SINGLE_WINNER_OP_COST = 500
 
 interface ShuffleInterface {
   openModal: boolean
@@ -77,20 +79,28 @@ const Shuffle = ({ openModal, setModalState }: ShuffleInterface) => {
         .simulate({ allowEmptySignatures: true })
 
       const { appId } = await verifiableShuffleClient.appClient.getAppReference()
-      const localState = await lookupAccountByAddress(activeAddress, indexerClient)
+      // algod answers with a 404 when the account has not opted into the app.
+      const appLocalState = await algodClient
+        .accountApplicationInformation(activeAddress, Number(appId))
+        .do()
+        .then((appInformation) => appInformation['app-local-state'])
+        .catch((e) => {
+          if (e?.response?.status === 404) {
+            return undefined
+          }
+          // Network, auth or server errors must not be mistaken for "not opted in".
+          throw e
+        })
       let commitContingentOptIn
-      if (localState.account['apps-local-state']?.find((localState) => localState.id == appId) !== undefined) {
+      if (appLocalState !== undefined) {
         commitContingentOptIn = verifiableShuffleClient
       } else {
         commitContingentOptIn = verifiableShuffleClient.optIn
       }
-      await commitContingentOptIn.commit(
-        { participants: Number(participants), winners: Number(winners), delay: 1 },
-        {
-          apps: [Number(knownOpUp)],
-          sendParams: { fee: algokit.algos(0.001 * (winners! + 2)) },
-        },
-      )
+      await commitContingentOptIn.commit({ participants: Number(participants), winners: Number(winners), delay: 1 })
+
+      // The outer call, the randomness beacon call and the opup calls that reveal issues for this many winners.
+      const revealFeeInTransactions = Math.floor((winners! * REVEAL_SINGLE_WINNER_OP_COST) / 700) + 3
 
       // FIXME
       // While we wait for this fix: https://github.com/algorandfoundation/algokit-client-generator-ts/pull/109#issuecomment-2372275240
@@ -102,7 +112,7 @@ const Shuffle = ({ openModal, setModalState }: ShuffleInterface) => {
           {},
           {
             apps: [Number(knownRandomnessBeacon), Number(knownOpUp)],
-            sendParams: { fee: algokit.algos(0.001 * (winners! + 3)) },
+            sendParams: { fee: algokit.algos(0.001 * revealFeeInTransactions) },
           },
         )
         .clearState()
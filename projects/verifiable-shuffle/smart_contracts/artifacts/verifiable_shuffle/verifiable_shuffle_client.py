@@ -70,7 +70,7 @@ _APP_SPEC_JSON = r"""{
         }
     },
     "source": {
-        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMudmVyaWZpYWJsZV9zaHVmZmxlLmNvbnRyYWN0LlZlcmlmaWFibGVTaHVmZmxlLmFwcHJvdmFsX3Byb2dyYW06CiAgICBpbnRjYmxvY2sgMSAwIDE2IDExIFRNUExfVkVSSUZJQUJMRV9TSFVGRkxFX09QVVAgVE1QTF9SQU5ET01ORVNTX0JFQUNPTiBUTVBMX1NBRkVUWV9ST1VORF9HQVAgMTQ0MjY5NTA0MDg4ODk2MzQwNyAxNDQyNjk1MDQwODg4OTYzNDA5IDE0NDI2OTUwNDA4ODg5NjM0MTEgMTQ0MjY5NTA0MDg4ODk2MzQxMyA0Mjk0OTY3Mjk1CiAgICBieXRlY2Jsb2NrIDB4IDB4MTUxZjdjNzUgImNvbW1pdG1lbnQiIDB4MDEgMHgwMDAwIDB4MDEwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAogICAgY2FsbHN1YiBfX3B1eWFfYXJjNF9yb3V0ZXJfXwogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZlcmlmaWFibGVfc2h1ZmZsZS5jb250cmFjdC5WZXJpZmlhYmxlU2h1ZmZsZS5fX3B1eWFfYXJjNF9yb3V0ZXJfXygpIC0+IHVpbnQ2NDoKX19wdXlhX2FyYzRfcm91dGVyX186CiAgICBwcm90byAwIDEKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBfX3B1eWFfYXJjNF9yb3V0ZXJfX19iYXJlX3JvdXRpbmdAOQogICAgcHVzaGJ5dGVzcyAweDdhZWIyMzNkIDB4ZTRlZmU1ZmYgMHg1OTgyNzQ1NSAweDUwNzI0Mzg0IDB4MzNjZTExZWIgLy8gbWV0aG9kICJnZXRfdGVtcGxhdGVkX3JhbmRvbW5lc3NfYmVhY29uX2lkKCl1aW50NjQiLCBtZXRob2QgImdldF90ZW1wbGF0ZWRfb3B1cF9pZCgpdWludDY0IiwgbWV0aG9kICJnZXRfdGVtcGxhdGVkX3NhZmV0eV9yb3VuZF9nYXAoKXVpbnQ2NCIsIG1ldGhvZCAiY29tbWl0KHVpbnQ4LHVpbnQzMix1aW50OCl2b2lkIiwgbWV0aG9kICJyZXZlYWwoKShieXRlWzMyXSx1aW50MzJbXSkiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBfX3B1eWFfYXJjNF9yb3V0ZXJfX19nZXRfdGVtcGxhdGVkX3JhbmRvbW5lc3NfYmVhY29uX2lkX3JvdXRlQDIgX19wdXlhX2FyYzRfcm91dGVyX19fZ2V0X3RlbXBsYXRlZF9vcHVwX2lkX3JvdXRlQDMgX19wdXlhX2FyYzRfcm91dGVyX19fZ2V0X3RlbXBsYXRlZF9zYWZldHlfcm91bmRfZ2FwX3JvdXRlQDQgX19wdXlhX2FyYzRfcm91dGVyX19fY29tbWl0X3JvdXRlQDUgX19wdXlhX2FyYzRfcm91dGVyX19fcmV2ZWFsX3JvdXRlQDYKICAgIGludGNfMSAvLyAwCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2dldF90ZW1wbGF0ZWRfcmFuZG9tbmVzc19iZWFjb25faWRfcm91dGVAMjoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X3RlbXBsYXRlZF9yYW5kb21uZXNzX2JlYWNvbl9pZAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fZ2V0X3RlbXBsYXRlZF9vcHVwX2lkX3JvdXRlQDM6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF90ZW1wbGF0ZWRfb3B1cF9pZAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fZ2V0X3RlbXBsYXRlZF9zYWZldHlfcm91bmRfZ2FwX3JvdXRlQDQ6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF90ZW1wbGF0ZWRfc2FmZXR5X3JvdW5kX2dhcAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fY29tbWl0X3JvdXRlQDU6CiAgICBpbnRjXzAgLy8gMQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgc2hsCiAgICBwdXNoaW50IDMgLy8gMwogICAgJgogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBvbmUgb2YgTm9PcCwgT3B0SW4KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBjYWxsc3ViIGNvbW1pdAogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fcmV2ZWFsX3JvdXRlQDY6CiAgICBpbnRjXzAgLy8gMQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgc2hsCiAgICBwdXNoaW50IDUgLy8gNQogICAgJgogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBvbmUgb2YgTm9PcCwgQ2xvc2VPdXQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHJldmVhbAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fYmFyZV9yb3V0aW5nQDk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBzd2l0Y2ggX19wdXlhX2FyYzRfcm91dGVyX19fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVAMTIgX19wdXlhX2FyYzRfcm91dGVyX19fYWZ0ZXJfaWZfZWxzZUAxNSBfX3B1eWFfYXJjNF9yb3V0ZXJfX19hZnRlcl9pZl9lbHNlQDE1IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2FmdGVyX2lmX2Vsc2VAMTUgX19wdXlhX2FyYzRfcm91dGVyX19fdXBkYXRlQDEwIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2RlbGV0ZUAxMQogICAgaW50Y18xIC8vIDAKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fdXBkYXRlQDEwOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgdXBkYXRlCiAgICBpbnRjXzAgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19kZWxldGVAMTE6CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBkZWxldGUKICAgIGludGNfMCAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDEyOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBpcyBjcmVhdGluZwogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fYWZ0ZXJfaWZfZWxzZUAxNToKICAgIGludGNfMSAvLyAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudmVyaWZpYWJsZV9zaHVmZmxlLmNvbnRyYWN0LlZlcmlmaWFibGVTaHVmZmxlLmdldF90ZW1wbGF0ZWRfcmFuZG9tbmVzc19iZWFjb25faWQoKSAtPiB1aW50NjQ6CmdldF90ZW1wbGF0ZWRfcmFuZG9tbmVzc19iZWFjb25faWQ6CiAgICBwcm90byAwIDEKICAgIGludGMgNSAvLyBUTVBMX1JBTkRPTU5FU1NfQkVBQ09OCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudmVyaWZpYWJsZV9zaHVmZmxlLmNvbnRyYWN0LlZlcmlmaWFibGVTaHVmZmxlLmdldF90ZW1wbGF0ZWRfb3B1cF9pZCgpIC0+IHVpbnQ2NDoKZ2V0X3RlbXBsYXRlZF9vcHVwX2lkOgogICAgcHJvdG8gMCAxCiAgICBpbnRjIDQgLy8gVE1QTF9WRVJJRklBQkxFX1NIVUZGTEVfT1BVUAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZlcmlmaWFibGVfc2h1ZmZsZS5jb250cmFjdC5WZXJpZmlhYmxlU2h1ZmZsZS5nZXRfdGVtcGxhdGVkX3NhZmV0eV9yb3VuZF9nYXAoKSAtPiB1aW50NjQ6CmdldF90ZW1wbGF0ZWRfc2FmZXR5X3JvdW5kX2dhcDoKICAgIHByb3RvIDAgMQogICAgaW50YyA2IC8vIFRNUExfU0FGRVRZX1JPVU5EX0dBUAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZlcmlmaWFibGVfc2h1ZmZsZS5jb250cmFjdC5WZXJpZmlhYmxlU2h1ZmZsZS5jb21taXQoZGVsYXk6IGJ5dGVzLCBwYXJ0aWNpcGFudHM6IGJ5dGVzLCB3aW5uZXJzOiBieXRlcykgLT4gdm9pZDoKY29tbWl0OgogICAgcHJvdG8gMyAwCiAgICBieXRlY18wIC8vICIiCiAgICBkdXBuIDIKICAgIGZyYW1lX2RpZyAtMwogICAgYnRvaQogICAgZHVwCiAgICBpbnRjIDYgLy8gVE1QTF9TQUZFVFlfUk9VTkRfR0FQCiAgICA+PQogICAgYXNzZXJ0IC8vIFRoZSByb3VuZCBkZWxheSBpcyBsZXNzIHRoYW4gdGhlIHNhZmV0eSBwYXJhbWV0ZXJzCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGR1cAogICAgaW50Y18wIC8vIDEKICAgID49CiAgICBieiBjb21taXRfYm9vbF9mYWxzZUAzCiAgICBmcmFtZV9kaWcgNAogICAgcHVzaGludCAzNSAvLyAzNQogICAgPAogICAgYnogY29tbWl0X2Jvb2xfZmFsc2VAMwogICAgaW50Y18wIC8vIDEKICAgIGIgY29tbWl0X2Jvb2xfbWVyZ2VANAoKY29tbWl0X2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMSAvLyAwCgpjb21taXRfYm9vbF9tZXJnZUA0OgogICAgYXNzZXJ0IC8vIFRoZXJlIG11c3QgYmUgYXQgbGVhc3Qgb25lIHdpbm5lciBhbmQgbGVzcyB0aGFuIDM1CiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICBkdXAKICAgIHB1c2hpbnQgMiAvLyAyCiAgICA+PQogICAgYXNzZXJ0IC8vIFRoZXJlIG11c3QgYmUgYXQgbGVhc3QgdHdvIHBhcnRpY2lwYW50cwogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICA8PQogICAgYXNzZXJ0IC8vIFdpbm5lcnMgbXVzdCBiZSBsZXNzIHRoYW4gb3IgZXF1YWwgdG8gUGFydGljaXBhbnRzCiAgICBwdXNoaW50IDYwMCAvLyA2MDAKICAgICoKICAgIHB1c2hpbnQgNzAwIC8vIDcwMAogICAgLwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMAoKY29tbWl0X2Zvcl9oZWFkZXJANToKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogY29tbWl0X2FmdGVyX2ZvckA5CiAgICBpdHhuX2JlZ2luCiAgICBpbnRjIDQgLy8gVE1QTF9WRVJJRklBQkxFX1NIVUZGTEVfT1BVUAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDAKICAgIGIgY29tbWl0X2Zvcl9oZWFkZXJANQoKY29tbWl0X2FmdGVyX2ZvckA5OgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyA0CiAgICBpbnRjXzIgLy8gMTYKICAgIGNhbGxzdWIga19wZXJtdXRhdGlvbl9sb2dhcml0aG0KICAgIHB1c2hpbnQgODM4ODYwOCAvLyA4Mzg4NjA4CiAgICA8PQogICAgYXNzZXJ0IC8vIFRoZSBudW1iZXIgb2Ygay1wZXJtdXRhdGlvbiBleGNlZWRzIHRoZSBzYWZldHkgcGFyYW1ldGVycwogICAgdHhuIFR4SUQKICAgIGdsb2JhbCBSb3VuZAogICAgZnJhbWVfZGlnIDMKICAgICsKICAgIGl0b2IKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICB0eG4gU2VuZGVyCiAgICBieXRlY18yIC8vICJjb21taXRtZW50IgogICAgdW5jb3ZlciAyCiAgICBhcHBfbG9jYWxfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudmVyaWZpYWJsZV9zaHVmZmxlLmNvbnRyYWN0LmtfcGVybXV0YXRpb25fbG9nYXJpdGhtKG46IHVpbnQ2NCwgazogdWludDY0LCBtOiB1aW50NjQpIC0+IHVpbnQ2NDoKa19wZXJtdXRhdGlvbl9sb2dhcml0aG06CiAgICBwcm90byAzIDEKICAgIGJ5dGVjXzAgLy8gIiIKICAgIGludGNfMCAvLyAxCiAgICBpbnRjXzEgLy8gMAogICAgZnJhbWVfZGlnIC0zCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTIKICAgIC0KICAgIGludGNfMCAvLyAxCiAgICArCgprX3Blcm11dGF0aW9uX2xvZ2FyaXRobV9mb3JfaGVhZGVyQDE6CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDMKICAgIDwKICAgIGJ6IGtfcGVybXV0YXRpb25fbG9nYXJpdGhtX2FmdGVyX2ZvckA4CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDQKICAgIG11bHcKICAgIGZyYW1lX2J1cnkgMAogICAgYm56IGtfcGVybXV0YXRpb25fbG9nYXJpdGhtX2lmX2JvZHlANAogICAgZnJhbWVfZGlnIDAKICAgIGJpdGxlbgogICAgcHVzaGludCA2NCAvLyA2NAogICAgPT0KICAgIGJ6IGtfcGVybXV0YXRpb25fbG9nYXJpdGhtX2Vsc2VfYm9keUA1CgprX3Blcm11dGF0aW9uX2xvZ2FyaXRobV9pZl9ib2R5QDQ6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGJpbmFyeV9sb2dhcml0aG0KICAgIGZyYW1lX2RpZyAyCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9idXJ5IDEKICAgIGIga19wZXJtdXRhdGlvbl9sb2dhcml0aG1fYWZ0ZXJfaWZfZWxzZUA2CgprX3Blcm11dGF0aW9uX2xvZ2FyaXRobV9lbHNlX2JvZHlANToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgNAogICAgKgogICAgZnJhbWVfYnVyeSAxCgprX3Blcm11dGF0aW9uX2xvZ2FyaXRobV9hZnRlcl9pZl9lbHNlQDY6CiAgICBmcmFtZV9kaWcgNAogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNAogICAgYiBrX3Blcm11dGF0aW9uX2xvZ2FyaXRobV9mb3JfaGVhZGVyQDEKCmtfcGVybXV0YXRpb25fbG9nYXJpdGhtX2FmdGVyX2ZvckA4OgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBiaW5hcnlfbG9nYXJpdGhtCiAgICBmcmFtZV9kaWcgMgogICAgKwogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudmVyaWZpYWJsZV9zaHVmZmxlLmNvbnRyYWN0LmJpbmFyeV9sb2dhcml0aG0objogdWludDY0LCBtOiB1aW50NjQpIC0+IHVpbnQ2NDoKYmluYXJ5X2xvZ2FyaXRobToKICAgIHByb3RvIDIgMQogICAgYnl0ZWNfMCAvLyAiIgogICAgZHVwbiAzCiAgICBmcmFtZV9kaWcgLTIKICAgIGJpdGxlbgogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGR1cAogICAgaW50Y18wIC8vIDEKICAgIHN3YXAKICAgIHNobAogICAgZHVwCiAgICBmcmFtZV9kaWcgLTIKICAgID09CiAgICBieiBiaW5hcnlfbG9nYXJpdGhtX2FmdGVyX2lmX2Vsc2VAMgogICAgZnJhbWVfZGlnIDQKICAgIGZyYW1lX2RpZyAtMQogICAgc2hsCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKYmluYXJ5X2xvZ2FyaXRobV9hZnRlcl9pZl9lbHNlQDI6CiAgICBpbnRjXzEgLy8gMAogICAgZnJhbWVfYnVyeSAxCiAgICBpbnRjXzEgLy8gMAogICAgZnJhbWVfYnVyeSAwCgpiaW5hcnlfbG9nYXJpdGhtX2Zvcl9oZWFkZXJAMzoKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgLTEKICAgIDwKICAgIGJ6IGJpbmFyeV9sb2dhcml0aG1fYWZ0ZXJfZm9yQDgKICAgIGZyYW1lX2RpZyAxCiAgICBpbnRjXzAgLy8gMQogICAgc2hsCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfZGlnIC0yCiAgICBkdXAKICAgIG11bHcKICAgIGZyYW1lX2RpZyA1CiAgICBkaXZ3CiAgICBmcmFtZV9idXJ5IC0yCiAgICBwdXNoaW50IDIgLy8gMgogICAgZnJhbWVfZGlnIDQKICAgIHNobAogICAgZnJhbWVfZGlnIC0yCiAgICA8PQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9idXJ5IDMKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMgogICAgYnogYmluYXJ5X2xvZ2FyaXRobV9hZnRlcl9pZl9lbHNlQDYKICAgIGZyYW1lX2RpZyAxCiAgICBpbnRjXzAgLy8gMQogICAgfAogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzAgLy8gMQogICAgc2hyCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgLTIKICAgIGZyYW1lX2J1cnkgMwogICAgZnJhbWVfYnVyeSAyCgpiaW5hcnlfbG9nYXJpdGhtX2FmdGVyX2lmX2Vsc2VANjoKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9idXJ5IC0yCiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9kaWcgMAogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMAogICAgYiBiaW5hcnlfbG9nYXJpdGhtX2Zvcl9oZWFkZXJAMwoKYmluYXJ5X2xvZ2FyaXRobV9hZnRlcl9mb3JAODoKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgLTEKICAgIHNobAogICAgZnJhbWVfZGlnIDEKICAgIHwKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZlcmlmaWFibGVfc2h1ZmZsZS5jb250cmFjdC5WZXJpZmlhYmxlU2h1ZmZsZS5yZXZlYWwoKSAtPiBieXRlczoKcmV2ZWFsOgogICAgcHJvdG8gMCAxCiAgICBpbnRjXzEgLy8gMAogICAgZHVwCiAgICBieXRlY18wIC8vICIiCiAgICBkdXBuIDEwCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMiAvLyAiY29tbWl0bWVudCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdG1lbnQgZXhpc3RzIGZvciBhY2NvdW50CiAgICB0eG4gU2VuZGVyCiAgICBieXRlY18yIC8vICJjb21taXRtZW50IgogICAgYXBwX2xvY2FsX2RlbAogICAgZHVwCiAgICBleHRyYWN0IDQwIDQgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBzd2FwCiAgICBkdXAKICAgIGV4dHJhY3QgNDQgMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIHN3YXAKICAgIGdsb2JhbCBSb3VuZAogICAgZGlnIDEKICAgIGV4dHJhY3QgMzIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgYnRvaQogICAgdW5jb3ZlciAyCiAgICA8PQogICAgYXNzZXJ0IC8vIFRoZSBjb21taXR0ZWQgcm91bmQgaGFzIG5vdCBlbGFwc2VkIHlldAogICAgaXR4bl9iZWdpbgogICAgc3dhcAogICAgZXh0cmFjdCAwIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgaW50YyA1IC8vIFRNUExfUkFORE9NTkVTU19CRUFDT04KICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgcHVzaGJ5dGVzIDB4NDdjMjBjMjMgLy8gbWV0aG9kICJtdXN0X2dldCh1aW50NjQsYnl0ZVtdKWJ5dGVbXSIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIExhc3RMb2cKICAgIGR1cAogICAgZXh0cmFjdCA0IDAKICAgIHN3YXAKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gQVJDNCBwcmVmaXggaXMgdmFsaWQKICAgIGludGNfMSAvLyAwCgpyZXZlYWxfZm9yX2hlYWRlckAyOgogICAgZnJhbWVfZGlnIDE3CiAgICBpbnRjXzMgLy8gMTEKICAgIDwKICAgIGJ6IHJldmVhbF9hZnRlcl9mb3JANQogICAgZnJhbWVfZGlnIDE3CiAgICBkdXAKICAgIGJ5dGVjXzAgLy8gMHgKICAgIHN0b3JlcwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMTcKICAgIGIgcmV2ZWFsX2Zvcl9oZWFkZXJAMgoKcmV2ZWFsX2FmdGVyX2ZvckA1OgogICAgZnJhbWVfZGlnIDE0CiAgICBwdXNoaW50IDUwMCAvLyA1MDAKICAgICoKICAgIHB1c2hpbnQgNzAwIC8vIDcwMAogICAgLwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNAogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMgoKcmV2ZWFsX2Zvcl9oZWFkZXJANjoKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgNAogICAgPAogICAgYnogcmV2ZWFsX2FmdGVyX2ZvckAxMAogICAgaXR4bl9iZWdpbgogICAgaW50YyA0IC8vIFRNUExfVkVSSUZJQUJMRV9TSFVGRkxFX09QVVAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMSAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIHJldmVhbF9mb3JfaGVhZGVyQDYKCnJldmVhbF9hZnRlcl9mb3JAMTA6CiAgICBmcmFtZV9kaWcgMTQKICAgIGZyYW1lX2RpZyAxMwogICAgPAogICAgYnogcmV2ZWFsX3Rlcm5hcnlfZmFsc2VAMTIKICAgIGZyYW1lX2RpZyAxNAogICAgZnJhbWVfYnVyeSA3CiAgICBiIHJldmVhbF90ZXJuYXJ5X21lcmdlQDEzCgpyZXZlYWxfdGVybmFyeV9mYWxzZUAxMjoKICAgIGZyYW1lX2RpZyAxNAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGZyYW1lX2J1cnkgNwoKcmV2ZWFsX3Rlcm5hcnlfbWVyZ2VAMTM6CiAgICBmcmFtZV9kaWcgMTYKICAgIGV4dHJhY3QgMiAwCiAgICBjYWxsc3ViIHBjZzEyOF9pbml0CiAgICBmcmFtZV9idXJ5IDExCiAgICBmcmFtZV9idXJ5IDEwCiAgICBmcmFtZV9idXJ5IDkKICAgIGZyYW1lX2J1cnkgOAogICAgYnl0ZWMgNCAvLyAweDAwMDAKICAgIGZyYW1lX2J1cnkgMAogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMTcKCnJldmVhbF9mb3JfaGVhZGVyQDE0OgogICAgZnJhbWVfZGlnIDE3CiAgICBmcmFtZV9kaWcgNwogICAgPAogICAgYnogcmV2ZWFsX2FmdGVyX2ZvckAyMAogICAgZnJhbWVfZGlnIDE3CiAgICBkdXAKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAxMwogICAgaXRvYgogICAgZnJhbWVfZGlnIDgKICAgIGZyYW1lX2RpZyA5CiAgICBmcmFtZV9kaWcgMTAKICAgIGZyYW1lX2RpZyAxMQogICAgdW5jb3ZlciA1CiAgICB1bmNvdmVyIDUKICAgIGludGNfMCAvLyAxCiAgICBjYWxsc3ViIHBjZzEyOF9yYW5kb20KICAgIGNvdmVyIDQKICAgIGZyYW1lX2J1cnkgMTEKICAgIGZyYW1lX2J1cnkgMTAKICAgIGZyYW1lX2J1cnkgOQogICAgZnJhbWVfYnVyeSA4CiAgICBleHRyYWN0IDIgMAogICAgZXh0cmFjdCAwIDE2IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgcHVzaGludCAxMiAvLyAxMgogICAgZXh0cmFjdF91aW50MzIKICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICBkaWcgMQogICAgaW50Y18zIC8vIDExCiAgICAlCiAgICBsb2FkcwogICAgZGlnIDIKICAgIGNhbGxzdWIgbGluZWFyX3NlYXJjaAogICAgY292ZXIgMgogICAgcG9wCiAgICB1bmNvdmVyIDMKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgZnJhbWVfYnVyeSAzCiAgICBkdXAKICAgIGludGNfMyAvLyAxMQogICAgJQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEyCiAgICBsb2FkcwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkaWcgMQogICAgY2FsbHN1YiBsaW5lYXJfc2VhcmNoCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDYKICAgIGNvdmVyIDIKICAgIGRpZyAyCiAgICBzZWxlY3QKICAgIGZyYW1lX2RpZyAwCiAgICBleHRyYWN0IDIgMAogICAgc3dhcAogICAgaXRvYgogICAgZXh0cmFjdCA0IDQKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICAvCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIGJ6IHJldmVhbF9lbHNlX2JvZHlAMTcKICAgIGZyYW1lX2RpZyA2CiAgICBwdXNoaW50IDQgLy8gNAogICAgKwogICAgZnJhbWVfZGlnIDMKICAgIGl0b2IKICAgIGV4dHJhY3QgNCA0CiAgICByZXBsYWNlMwogICAgYiByZXZlYWxfYWZ0ZXJfaWZfZWxzZUAxOAoKcmV2ZWFsX2Vsc2VfYm9keUAxNzoKICAgIGZyYW1lX2RpZyA1CiAgICBpdG9iCiAgICBleHRyYWN0IDQgNAogICAgZnJhbWVfZGlnIDMKICAgIGl0b2IKICAgIGV4dHJhY3QgNCA0CiAgICBjb25jYXQKICAgIGNvbmNhdAoKcmV2ZWFsX2FmdGVyX2lmX2Vsc2VAMTg6CiAgICBmcmFtZV9kaWcgMTIKICAgIHN3YXAKICAgIHN0b3JlcwogICAgZnJhbWVfZGlnIDE3CiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxNwogICAgYiByZXZlYWxfZm9yX2hlYWRlckAxNAoKcmV2ZWFsX2FmdGVyX2ZvckAyMDoKICAgIGZyYW1lX2RpZyAxMwogICAgZnJhbWVfZGlnIDE0CiAgICA9PQogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2J1cnkgMQogICAgYnogcmV2ZWFsX2FmdGVyX2lmX2Vsc2VAMjIKICAgIGZyYW1lX2RpZyAxNAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGR1cAogICAgaW50Y18zIC8vIDExCiAgICAlCiAgICBsb2FkcwogICAgZGlnIDEKICAgIGNhbGxzdWIgbGluZWFyX3NlYXJjaAogICAgY292ZXIgMgogICAgcG9wCiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdCAyIDAKICAgIGNvdmVyIDMKICAgIHNlbGVjdAogICAgaXRvYgogICAgZXh0cmFjdCA0IDQKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICAvCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDEKCnJldmVhbF9hZnRlcl9pZl9lbHNlQDIyOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAxNQogICAgcHVzaGJ5dGVzIDB4MDAyMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gbGliX3BjZy5wY2cxMjgucGNnMTI4X2luaXQoc2VlZDogYnl0ZXMpIC0+IHVpbnQ2NCwgdWludDY0LCB1aW50NjQsIHVpbnQ2NDoKcGNnMTI4X2luaXQ6CiAgICBwcm90byAxIDQKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50YyA3IC8vIDE0NDI2OTUwNDA4ODg5NjM0MDcKICAgIGNhbGxzdWIgX19wY2czMl9pbml0CiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50YyA4IC8vIDE0NDI2OTUwNDA4ODg5NjM0MDkKICAgIGNhbGxzdWIgX19wY2czMl9pbml0CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMiAvLyAxNgogICAgZXh0cmFjdF91aW50NjQKICAgIGludGMgOSAvLyAxNDQyNjk1MDQwODg4OTYzNDExCiAgICBjYWxsc3ViIF9fcGNnMzJfaW5pdAogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDI0IC8vIDI0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50YyAxMCAvLyAxNDQyNjk1MDQwODg4OTYzNDEzCiAgICBjYWxsc3ViIF9fcGNnMzJfaW5pdAogICAgcmV0c3ViCgoKLy8gbGliX3BjZy5wY2czMi5fX3BjZzMyX2luaXQoaW5pdGlhbF9zdGF0ZTogdWludDY0LCBpbmNyOiB1aW50NjQpIC0+IHVpbnQ2NDoKX19wY2czMl9pbml0OgogICAgcHJvdG8gMiAxCiAgICBpbnRjXzEgLy8gMAogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9fcGNnMzJfc3RlcAogICAgZnJhbWVfZGlnIC0yCiAgICBhZGR3CiAgICBidXJ5IDEKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfX3BjZzMyX3N0ZXAKICAgIHJldHN1YgoKCi8vIGxpYl9wY2cucGNnMzIuX19wY2czMl9zdGVwKHN0YXRlOiB1aW50NjQsIGluY3I6IHVpbnQ2NCkgLT4gdWludDY0OgpfX3BjZzMyX3N0ZXA6CiAgICBwcm90byAyIDEKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGludCA2MzY0MTM2MjIzODQ2NzkzMDA1IC8vIDYzNjQxMzYyMjM4NDY3OTMwMDUKICAgIG11bHcKICAgIGJ1cnkgMQogICAgZnJhbWVfZGlnIC0xCiAgICBhZGR3CiAgICBidXJ5IDEKICAgIHJldHN1YgoKCi8vIGxpYl9wY2cucGNnMTI4LnBjZzEyOF9yYW5kb20oc3RhdGUuMDogdWludDY0LCBzdGF0ZS4xOiB1aW50NjQsIHN0YXRlLjI6IHVpbnQ2NCwgc3RhdGUuMzogdWludDY0LCBsb3dlcl9ib3VuZDogYnl0ZXMsIHVwcGVyX2JvdW5kOiBieXRlcywgbGVuZ3RoOiB1aW50NjQpIC0+IHVpbnQ2NCwgdWludDY0LCB1aW50NjQsIHVpbnQ2NCwgYnl0ZXM6CnBjZzEyOF9yYW5kb206CiAgICBwcm90byA3IDUKICAgIGludGNfMSAvLyAwCiAgICBkdXBuIDIKICAgIGJ5dGVjXzAgLy8gIiIKICAgIGJ5dGVjIDQgLy8gMHgwMDAwCiAgICBmcmFtZV9kaWcgLTMKICAgIGJ5dGVjXzAgLy8gMHgKICAgIGI9PQogICAgYnogcGNnMTI4X3JhbmRvbV9lbHNlX2JvZHlANwogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlY18wIC8vIDB4CiAgICBiPT0KICAgIGJ6IHBjZzEyOF9yYW5kb21fZWxzZV9ib2R5QDcKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDMKCnBjZzEyOF9yYW5kb21fZm9yX2hlYWRlckAzOgogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAtMQogICAgPAogICAgYnogcGNnMTI4X3JhbmRvbV9hZnRlcl9pZl9lbHNlQDIwCiAgICBmcmFtZV9kaWcgLTcKICAgIGZyYW1lX2RpZyAtNgogICAgZnJhbWVfZGlnIC01CiAgICBmcmFtZV9kaWcgLTQKICAgIGNhbGxzdWIgX19wY2cxMjhfdW5ib3VuZGVkX3JhbmRvbQogICAgY292ZXIgNAogICAgZnJhbWVfYnVyeSAtNAogICAgZnJhbWVfYnVyeSAtNQogICAgZnJhbWVfYnVyeSAtNgogICAgZnJhbWVfYnVyeSAtNwogICAgZnJhbWVfZGlnIDQKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgbGVuCiAgICBpbnRjXzIgLy8gMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGludGNfMiAvLyAxNgogICAgYnplcm8KICAgIHVuY292ZXIgMgogICAgYnwKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAxNgogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSA0CiAgICBmcmFtZV9kaWcgMwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgYiBwY2cxMjhfcmFuZG9tX2Zvcl9oZWFkZXJAMwoKcGNnMTI4X3JhbmRvbV9lbHNlX2JvZHlANzoKICAgIGZyYW1lX2RpZyAtMgogICAgYnl0ZWNfMCAvLyAweAogICAgYiE9CiAgICBieiBwY2cxMjhfcmFuZG9tX2Vsc2VfYm9keUA5CiAgICBmcmFtZV9kaWcgLTIKICAgIGJ5dGVjXzMgLy8gMHgwMQogICAgYj4KICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlYyA1IC8vIDB4MDEwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAogICAgYjwKICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlY18zIC8vIDB4MDEKICAgIGItCiAgICBmcmFtZV9kaWcgLTMKICAgIGI+CiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0zCiAgICBiLQogICAgZnJhbWVfYnVyeSAwCiAgICBiIHBjZzEyOF9yYW5kb21fYWZ0ZXJfaWZfZWxzZUAxMAoKcGNnMTI4X3JhbmRvbV9lbHNlX2JvZHlAOToKICAgIGZyYW1lX2RpZyAtMwogICAgcHVzaGJ5dGVzIDB4ODAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGI8CiAgICBhc3NlcnQKICAgIGJ5dGVjIDUgLy8gMHgwMTAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICBmcmFtZV9kaWcgLTMKICAgIGItCiAgICBmcmFtZV9idXJ5IDAKCnBjZzEyOF9yYW5kb21fYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNhbGxzdWIgX191aW50MTI4X3R3b3MKICAgIHN3YXAKICAgIGIlCiAgICBmcmFtZV9idXJ5IDIKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDMKCnBjZzEyOF9yYW5kb21fZm9yX2hlYWRlckAxMToKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9kaWcgLTEKICAgIDwKICAgIGJ6IHBjZzEyOF9yYW5kb21fYWZ0ZXJfZm9yQDE5CgpwY2cxMjhfcmFuZG9tX3doaWxlX3RvcEAxMzoKICAgIGZyYW1lX2RpZyAtNwogICAgZnJhbWVfZGlnIC02CiAgICBmcmFtZV9kaWcgLTUKICAgIGZyYW1lX2RpZyAtNAogICAgY2FsbHN1YiBfX3BjZzEyOF91bmJvdW5kZWRfcmFuZG9tCiAgICBkdXAKICAgIGNvdmVyIDUKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAtNAogICAgZnJhbWVfYnVyeSAtNQogICAgZnJhbWVfYnVyeSAtNgogICAgZnJhbWVfYnVyeSAtNwogICAgZnJhbWVfZGlnIDIKICAgIGI+PQogICAgYnogcGNnMTI4X3JhbmRvbV93aGlsZV90b3BAMTMKICAgIGZyYW1lX2RpZyA0CiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICBiJQogICAgZnJhbWVfZGlnIC0zCiAgICBiKwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAxNgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgaW50Y18yIC8vIDE2CiAgICBiemVybwogICAgYnwKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAxNgogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSA0CiAgICBmcmFtZV9kaWcgMwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgYiBwY2cxMjhfcmFuZG9tX2Zvcl9oZWFkZXJAMTEKCnBjZzEyOF9yYW5kb21fYWZ0ZXJfZm9yQDE5OgoKcGNnMTI4X3JhbmRvbV9hZnRlcl9pZl9lbHNlQDIwOgogICAgZnJhbWVfZGlnIC03CiAgICBmcmFtZV9kaWcgLTYKICAgIGZyYW1lX2RpZyAtNQogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgNAogICAgdW5jb3ZlciA5CiAgICB1bmNvdmVyIDkKICAgIHVuY292ZXIgOQogICAgdW5jb3ZlciA5CiAgICB1bmNvdmVyIDkKICAgIHJldHN1YgoKCi8vIGxpYl9wY2cucGNnMTI4Ll9fcGNnMTI4X3VuYm91bmRlZF9yYW5kb20oc3RhdGUuMDogdWludDY0LCBzdGF0ZS4xOiB1aW50NjQsIHN0YXRlLjI6IHVpbnQ2NCwgc3RhdGUuMzogdWludDY0KSAtPiB1aW50NjQsIHVpbnQ2NCwgdWludDY0LCB1aW50NjQsIGJ5dGVzOgpfX3BjZzEyOF91bmJvdW5kZWRfcmFuZG9tOgogICAgcHJvdG8gNCA1CiAgICBmcmFtZV9kaWcgLTQKICAgIGludGMgNyAvLyAxNDQyNjk1MDQwODg4OTYzNDA3CiAgICBjYWxsc3ViIF9fcGNnMzJfc3RlcAogICAgZHVwCiAgICAhCiAgICBpbnRjIDggLy8gMTQ0MjY5NTA0MDg4ODk2MzQwOQogICAgc3dhcAogICAgc2hsCiAgICBmcmFtZV9kaWcgLTMKICAgIHN3YXAKICAgIGNhbGxzdWIgX19wY2czMl9zdGVwCiAgICBkdXAKICAgICEKICAgIGludGMgOSAvLyAxNDQyNjk1MDQwODg4OTYzNDExCiAgICBzd2FwCiAgICBzaGwKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgY2FsbHN1YiBfX3BjZzMyX3N0ZXAKICAgIGR1cAogICAgIQogICAgaW50YyAxMCAvLyAxNDQyNjk1MDQwODg4OTYzNDEzCiAgICBzd2FwCiAgICBzaGwKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgY2FsbHN1YiBfX3BjZzMyX3N0ZXAKICAgIGZyYW1lX2RpZyAtNAogICAgY2FsbHN1YiBfX3BjZzMyX291dHB1dAogICAgcHVzaGludCAzMiAvLyAzMgogICAgc2hsCiAgICBmcmFtZV9kaWcgLTMKICAgIGNhbGxzdWIgX19wY2czMl9vdXRwdXQKICAgIHwKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBfX3BjZzMyX291dHB1dAogICAgcHVzaGludCAzMiAvLyAzMgogICAgc2hsCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX19wY2czMl9vdXRwdXQKICAgIHwKICAgIGl0b2IKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gbGliX3BjZy5wY2czMi5fX3BjZzMyX291dHB1dChzdGF0ZTogdWludDY0KSAtPiB1aW50NjQ6Cl9fcGNnMzJfb3V0cHV0OgogICAgcHJvdG8gMSAxCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgMTggLy8gMTgKICAgIHNocgogICAgZnJhbWVfZGlnIC0xCiAgICBeCiAgICBwdXNoaW50IDI3IC8vIDI3CiAgICBzaHIKICAgIGludGMgMTEgLy8gNDI5NDk2NzI5NQogICAgJgogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDU5IC8vIDU5CiAgICBzaHIKICAgIGR1cAogICAgfgogICAgaW50Y18wIC8vIDEKICAgIGFkZHcKICAgIGJ1cnkgMQogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc2hyCiAgICBzd2FwCiAgICBwdXNoaW50IDMxIC8vIDMxCiAgICAmCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIHNobAogICAgaW50YyAxMSAvLyA0Mjk0OTY3Mjk1CiAgICAmCiAgICB8CiAgICByZXRzdWIKCgovLyBsaWJfcGNnLnBjZzEyOC5fX3VpbnQxMjhfdHdvcyh2YWx1ZTogYnl0ZXMpIC0+IGJ5dGVzOgpfX3VpbnQxMjhfdHdvczoKICAgIHByb3RvIDEgMQogICAgZnJhbWVfZGlnIC0xCiAgICBifgogICAgYnl0ZWNfMyAvLyAweDAxCiAgICBiKwogICAgcHVzaGJ5dGVzIDB4ZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmYKICAgIGImCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudmVyaWZpYWJsZV9zaHVmZmxlLmNvbnRyYWN0LmxpbmVhcl9zZWFyY2goYmluX2xpc3Q6IGJ5dGVzLCBrZXk6IHVpbnQ2NCkgLT4gdWludDY0LCB1aW50NjQsIHVpbnQ2NDoKbGluZWFyX3NlYXJjaDoKICAgIHByb3RvIDIgMwogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGludGNfMSAvLyAwCgpsaW5lYXJfc2VhcmNoX2Zvcl9oZWFkZXJAMToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMAogICAgPAogICAgYnogbGluZWFyX3NlYXJjaF9hZnRlcl9mb3JANgogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgMQogICAgZXh0cmFjdF91aW50MzIKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGJ6IGxpbmVhcl9zZWFyY2hfYWZ0ZXJfaWZfZWxzZUA0CiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBwdXNoaW50IDQgLy8gNAogICAgKwogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQzMgogICAgaW50Y18wIC8vIDEKICAgIGNvdmVyIDIKICAgIHVuY292ZXIgNAogICAgdW5jb3ZlciA0CiAgICByZXRzdWIKCmxpbmVhcl9zZWFyY2hfYWZ0ZXJfaWZfZWxzZUA0OgogICAgZnJhbWVfZGlnIDEKICAgIHB1c2hpbnQgOCAvLyA4CiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgbGluZWFyX3NlYXJjaF9mb3JfaGVhZGVyQDEKCmxpbmVhcl9zZWFyY2hfYWZ0ZXJfZm9yQDY6CiAgICBpbnRjXzEgLy8gMAogICAgZHVwbiAyCiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgNAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZlcmlmaWFibGVfc2h1ZmZsZS5jb250cmFjdC5WZXJpZmlhYmxlU2h1ZmZsZS51cGRhdGUoKSAtPiB2b2lkOgp1cGRhdGU6CiAgICBwcm90byAwIDAKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGlzIG5vdCB0aGUgY3JlYXRvcgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZlcmlmaWFibGVfc2h1ZmZsZS5jb250cmFjdC5WZXJpZmlhYmxlU2h1ZmZsZS5kZWxldGUoKSAtPiB2b2lkOgpkZWxldGU6CiAgICBwcm90byAwIDAKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGlzIG5vdCB0aGUgY3JlYXRvcgogICAgcmV0c3ViCg==",
+        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMudmVyaWZpYWJsZV9zaHVmZmxlLmNvbnRyYWN0LlZlcmlmaWFibGVTaHVmZmxlLmFwcHJvdmFsX3Byb2dyYW06CiAgICBpbnRjYmxvY2sgMSAwIDE2IDMyIDQyOTQ5NjcyOTUgVE1QTF9SQU5ET01ORVNTX0JFQUNPTiBUTVBMX1ZFUklGSUFCTEVfU0hVRkZMRV9PUFVQIFRNUExfU0FGRVRZX1JPVU5EX0dBUCAxNDQyNjk1MDQwODg4OTYzNDA3IDE0NDI2OTUwNDA4ODg5NjM0MDkgMTQ0MjY5NTA0MDg4ODk2MzQxMSAxNDQyNjk1MDQwODg4OTYzNDEzCiAgICBieXRlY2Jsb2NrIDB4IDB4MTUxZjdjNzUgImNvbW1pdG1lbnQiIDB4MDEgMHgwMDIyIDB4MDEwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAogICAgY2FsbHN1YiBfX3B1eWFfYXJjNF9yb3V0ZXJfXwogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZlcmlmaWFibGVfc2h1ZmZsZS5jb250cmFjdC5WZXJpZmlhYmxlU2h1ZmZsZS5fX3B1eWFfYXJjNF9yb3V0ZXJfXygpIC0+IHVpbnQ2NDoKX19wdXlhX2FyYzRfcm91dGVyX186CiAgICBwcm90byAwIDEKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBfX3B1eWFfYXJjNF9yb3V0ZXJfX19iYXJlX3JvdXRpbmdAOQogICAgcHVzaGJ5dGVzcyAweDdhZWIyMzNkIDB4ZTRlZmU1ZmYgMHg1OTgyNzQ1NSAweDUwNzI0Mzg0IDB4MzNjZTExZWIgLy8gbWV0aG9kICJnZXRfdGVtcGxhdGVkX3JhbmRvbW5lc3NfYmVhY29uX2lkKCl1aW50NjQiLCBtZXRob2QgImdldF90ZW1wbGF0ZWRfb3B1cF9pZCgpdWludDY0IiwgbWV0aG9kICJnZXRfdGVtcGxhdGVkX3NhZmV0eV9yb3VuZF9nYXAoKXVpbnQ2NCIsIG1ldGhvZCAiY29tbWl0KHVpbnQ4LHVpbnQzMix1aW50OCl2b2lkIiwgbWV0aG9kICJyZXZlYWwoKShieXRlWzMyXSx1aW50MzJbXSkiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBfX3B1eWFfYXJjNF9yb3V0ZXJfX19nZXRfdGVtcGxhdGVkX3JhbmRvbW5lc3NfYmVhY29uX2lkX3JvdXRlQDIgX19wdXlhX2FyYzRfcm91dGVyX19fZ2V0X3RlbXBsYXRlZF9vcHVwX2lkX3JvdXRlQDMgX19wdXlhX2FyYzRfcm91dGVyX19fZ2V0X3RlbXBsYXRlZF9zYWZldHlfcm91bmRfZ2FwX3JvdXRlQDQgX19wdXlhX2FyYzRfcm91dGVyX19fY29tbWl0X3JvdXRlQDUgX19wdXlhX2FyYzRfcm91dGVyX19fcmV2ZWFsX3JvdXRlQDYKICAgIGludGNfMSAvLyAwCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2dldF90ZW1wbGF0ZWRfcmFuZG9tbmVzc19iZWFjb25faWRfcm91dGVAMjoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X3RlbXBsYXRlZF9yYW5kb21uZXNzX2JlYWNvbl9pZAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fZ2V0X3RlbXBsYXRlZF9vcHVwX2lkX3JvdXRlQDM6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF90ZW1wbGF0ZWRfb3B1cF9pZAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fZ2V0X3RlbXBsYXRlZF9zYWZldHlfcm91bmRfZ2FwX3JvdXRlQDQ6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF90ZW1wbGF0ZWRfc2FmZXR5X3JvdW5kX2dhcAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fY29tbWl0X3JvdXRlQDU6CiAgICBpbnRjXzAgLy8gMQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgc2hsCiAgICBwdXNoaW50IDMgLy8gMwogICAgJgogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBvbmUgb2YgTm9PcCwgT3B0SW4KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBjYWxsc3ViIGNvbW1pdAogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fcmV2ZWFsX3JvdXRlQDY6CiAgICBpbnRjXzAgLy8gMQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgc2hsCiAgICBwdXNoaW50IDUgLy8gNQogICAgJgogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBvbmUgb2YgTm9PcCwgQ2xvc2VPdXQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHJldmVhbAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fYmFyZV9yb3V0aW5nQDk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBzd2l0Y2ggX19wdXlhX2FyYzRfcm91dGVyX19fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVAMTIgX19wdXlhX2FyYzRfcm91dGVyX19fYWZ0ZXJfaWZfZWxzZUAxNSBfX3B1eWFfYXJjNF9yb3V0ZXJfX19hZnRlcl9pZl9lbHNlQDE1IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2FmdGVyX2lmX2Vsc2VAMTUgX19wdXlhX2FyYzRfcm91dGVyX19fdXBkYXRlQDEwIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2RlbGV0ZUAxMQogICAgaW50Y18xIC8vIDAKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fdXBkYXRlQDEwOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgdXBkYXRlCiAgICBpbnRjXzAgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19kZWxldGVAMTE6CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBkZWxldGUKICAgIGludGNfMCAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDEyOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBpcyBjcmVhdGluZwogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fYWZ0ZXJfaWZfZWxzZUAxNToKICAgIGludGNfMSAvLyAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudmVyaWZpYWJsZV9zaHVmZmxlLmNvbnRyYWN0LlZlcmlmaWFibGVTaHVmZmxlLmdldF90ZW1wbGF0ZWRfcmFuZG9tbmVzc19iZWFjb25faWQoKSAtPiB1aW50NjQ6CmdldF90ZW1wbGF0ZWRfcmFuZG9tbmVzc19iZWFjb25faWQ6CiAgICBwcm90byAwIDEKICAgIGludGMgNSAvLyBUTVBMX1JBTkRPTU5FU1NfQkVBQ09OCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudmVyaWZpYWJsZV9zaHVmZmxlLmNvbnRyYWN0LlZlcmlmaWFibGVTaHVmZmxlLmdldF90ZW1wbGF0ZWRfb3B1cF9pZCgpIC0+IHVpbnQ2NDoKZ2V0X3RlbXBsYXRlZF9vcHVwX2lkOgogICAgcHJvdG8gMCAxCiAgICBpbnRjIDYgLy8gVE1QTF9WRVJJRklBQkxFX1NIVUZGTEVfT1BVUAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZlcmlmaWFibGVfc2h1ZmZsZS5jb250cmFjdC5WZXJpZmlhYmxlU2h1ZmZsZS5nZXRfdGVtcGxhdGVkX3NhZmV0eV9yb3VuZF9nYXAoKSAtPiB1aW50NjQ6CmdldF90ZW1wbGF0ZWRfc2FmZXR5X3JvdW5kX2dhcDoKICAgIHByb3RvIDAgMQogICAgaW50YyA3IC8vIFRNUExfU0FGRVRZX1JPVU5EX0dBUAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZlcmlmaWFibGVfc2h1ZmZsZS5jb250cmFjdC5WZXJpZmlhYmxlU2h1ZmZsZS5jb21taXQoZGVsYXk6IGJ5dGVzLCBwYXJ0aWNpcGFudHM6IGJ5dGVzLCB3aW5uZXJzOiBieXRlcykgLT4gdm9pZDoKY29tbWl0OgogICAgcHJvdG8gMyAwCiAgICBmcmFtZV9kaWcgLTMKICAgIGJ0b2kKICAgIGR1cAogICAgaW50YyA3IC8vIFRNUExfU0FGRVRZX1JPVU5EX0dBUAogICAgPj0KICAgIGFzc2VydCAvLyBUaGUgcm91bmQgZGVsYXkgaXMgbGVzcyB0aGFuIHRoZSBzYWZldHkgcGFyYW1ldGVycwogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBkdXAKICAgIGludGNfMCAvLyAxCiAgICA+PQogICAgYnogY29tbWl0X2Jvb2xfZmFsc2VAMwogICAgZnJhbWVfZGlnIDEKICAgIHB1c2hpbnQgMzUgLy8gMzUKICAgIDwKICAgIGJ6IGNvbW1pdF9ib29sX2ZhbHNlQDMKICAgIGludGNfMCAvLyAxCiAgICBiIGNvbW1pdF9ib29sX21lcmdlQDQKCmNvbW1pdF9ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzEgLy8gMAoKY29tbWl0X2Jvb2xfbWVyZ2VANDoKICAgIGFzc2VydCAvLyBUaGVyZSBtdXN0IGJlIGF0IGxlYXN0IG9uZSB3aW5uZXIgYW5kIGxlc3MgdGhhbiAzNQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBkdXAKICAgIHB1c2hpbnQgMiAvLyAyCiAgICA+PQogICAgYXNzZXJ0IC8vIFRoZXJlIG11c3QgYmUgYXQgbGVhc3QgdHdvIHBhcnRpY2lwYW50cwogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgZGlnIDIKICAgIDw9CiAgICBhc3NlcnQgLy8gV2lubmVycyBtdXN0IGJlIGxlc3MgdGhhbiBvciBlcXVhbCB0byBQYXJ0aWNpcGFudHMKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBwdXNoaW50IDQgLy8gNAogICAgKgogICAgcHVzaGJ5dGVzIDB4ZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmYwMzA4MGMwMjAwMjg1MTQ4MDAwNGUwNDgwMDAxMDAwMzAwMDA0YWFjMDAwMDFiZTAwMDAwMGM3NDAwMDAwNjVmMDAwMDAzOWUwMDAwMDIzYjAwMDAwMTc5MDAwMDAxMDcwMDAwMDBjMDAwMDAwMDkyMDAwMDAwNzMwMDAwMDA1ZTAwMDAwMDRlMDAwMDAwNDMwMDAwMDAzYTAwMDAwMDM0MDAwMDAwMmYwMDAwMDAyYjAwMDAwMDI4MDAwMDAwMjYwMDAwMDAyNDAwMDAwMDIzMDAwMDAwMjIwMDAwMDAyMjAwMDAwMDIyMDAwMDAwMjIKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIFRoZSBudW1iZXIgb2Ygay1wZXJtdXRhdGlvbiBleGNlZWRzIHRoZSBzYWZldHkgcGFyYW1ldGVycwogICAgdHhuIFR4SUQKICAgIGdsb2JhbCBSb3VuZAogICAgZnJhbWVfZGlnIDAKICAgICsKICAgIGl0b2IKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICB0eG4gU2VuZGVyCiAgICBieXRlY18yIC8vICJjb21taXRtZW50IgogICAgdW5jb3ZlciAyCiAgICBhcHBfbG9jYWxfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudmVyaWZpYWJsZV9zaHVmZmxlLmNvbnRyYWN0LlZlcmlmaWFibGVTaHVmZmxlLnJldmVhbCgpIC0+IGJ5dGVzOgpyZXZlYWw6CiAgICBwcm90byAwIDEKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18wIC8vICIiCiAgICBkdXBuIDEyCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMiAvLyAiY29tbWl0bWVudCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdG1lbnQgZXhpc3RzIGZvciBhY2NvdW50CiAgICB0eG4gU2VuZGVyCiAgICBieXRlY18yIC8vICJjb21taXRtZW50IgogICAgYXBwX2xvY2FsX2RlbAogICAgZHVwCiAgICBleHRyYWN0IDQwIDQgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBzd2FwCiAgICBkdXAKICAgIGV4dHJhY3QgNDQgMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBnbG9iYWwgUm91bmQKICAgIGRpZyAxCiAgICBleHRyYWN0IDMyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGJ0b2kKICAgIHVuY292ZXIgMgogICAgPD0KICAgIGFzc2VydCAvLyBUaGUgY29tbWl0dGVkIHJvdW5kIGhhcyBub3QgZWxhcHNlZCB5ZXQKICAgIGl0eG5fYmVnaW4KICAgIHN3YXAKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgY292ZXIgMwogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGludGMgNSAvLyBUTVBMX1JBTkRPTU5FU1NfQkVBQ09OCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIHB1c2hieXRlcyAweDQ3YzIwYzIzIC8vIG1ldGhvZCAibXVzdF9nZXQodWludDY0LGJ5dGVbXSlieXRlW10iCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBjb3ZlciAyCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIEFSQzQgcHJlZml4IGlzIHZhbGlkCiAgICBwdXNoaW50IDUwMCAvLyA1MDAKICAgICoKICAgIHB1c2hpbnQgNzAwIC8vIDcwMAogICAgLwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGludGNfMSAvLyAwCgpyZXZlYWxfZm9yX2hlYWRlckAyOgogICAgZnJhbWVfZGlnIDE5CiAgICBmcmFtZV9kaWcgMTgKICAgIDwKICAgIGJ6IHJldmVhbF9hZnRlcl9mb3JANgogICAgaXR4bl9iZWdpbgogICAgaW50YyA2IC8vIFRNUExfVkVSSUZJQUJMRV9TSFVGRkxFX09QVVAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMSAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGZyYW1lX2RpZyAxOQogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMTkKICAgIGIgcmV2ZWFsX2Zvcl9oZWFkZXJAMgoKcmV2ZWFsX2FmdGVyX2ZvckA2OgogICAgZnJhbWVfZGlnIDE3CiAgICBleHRyYWN0IDIgMAogICAgY2FsbHN1YiBwY2cxMjhfaW5pdAogICAgZnJhbWVfYnVyeSAxMwogICAgZnJhbWVfYnVyeSAxMgogICAgZnJhbWVfYnVyeSAxMQogICAgZnJhbWVfYnVyeSAxMAogICAgZnJhbWVfZGlnIDE1CiAgICBpbnRjXzAgLy8gMQogICAgPT0KICAgIGJ6IHJldmVhbF9hZnRlcl9pZl9lbHNlQDgKICAgIGZyYW1lX2RpZyAxNAogICAgaXRvYgogICAgZnJhbWVfZGlnIDEwCiAgICBmcmFtZV9kaWcgMTEKICAgIGZyYW1lX2RpZyAxMgogICAgZnJhbWVfZGlnIDEzCiAgICBieXRlY18wIC8vIDB4CiAgICB1bmNvdmVyIDUKICAgIGludGNfMCAvLyAxCiAgICBjYWxsc3ViIHBjZzEyOF9yYW5kb20KICAgIGNvdmVyIDQKICAgIHBvcG4gNAogICAgZXh0cmFjdCAyIDAKICAgIGV4dHJhY3QgMCAxNiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgaXRvYgogICAgZXh0cmFjdCA0IDQKICAgIHB1c2hieXRlcyAweDAwMDEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDE2CiAgICBieXRlYyA0IC8vIDB4MDAyMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpyZXZlYWxfYWZ0ZXJfaWZfZWxzZUA4OgogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMwoKcmV2ZWFsX2Zvcl9oZWFkZXJAOToKICAgIGZyYW1lX2RpZyAzCiAgICBwdXNoaW50IDExIC8vIDExCiAgICA8CiAgICBieiByZXZlYWxfYWZ0ZXJfZm9yQDEyCiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBieXRlY18wIC8vIDB4CiAgICBzdG9yZXMKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDMKICAgIGIgcmV2ZWFsX2Zvcl9oZWFkZXJAOQoKcmV2ZWFsX2FmdGVyX2ZvckAxMjoKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDgKICAgIGludGNfMCAvLyAxCiAgICBmcmFtZV9idXJ5IDkKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDMKCnJldmVhbF9mb3JfaGVhZGVyQDEzOgogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAxNQogICAgPAogICAgYnogcmV2ZWFsX2FmdGVyX2ZvckAxNgogICAgZnJhbWVfZGlnIDE0CiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICAtCiAgICBmcmFtZV9kaWcgOQogICAgZGlnIDEKICAgIG11bHcKICAgIGZyYW1lX2J1cnkgOQogICAgc3dhcAogICAgZnJhbWVfZGlnIDgKICAgICoKICAgICsKICAgIGZyYW1lX2J1cnkgOAogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgYiByZXZlYWxfZm9yX2hlYWRlckAxMwoKcmV2ZWFsX2FmdGVyX2ZvckAxNjoKICAgIGZyYW1lX2RpZyA4CiAgICBpdG9iCiAgICBmcmFtZV9kaWcgOQogICAgaXRvYgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMTAKICAgIGZyYW1lX2RpZyAxMQogICAgZnJhbWVfZGlnIDEyCiAgICBmcmFtZV9kaWcgMTMKICAgIGJ5dGVjXzAgLy8gMHgKICAgIHVuY292ZXIgNQogICAgaW50Y18wIC8vIDEKICAgIGNhbGxzdWIgcGNnMTI4X3JhbmRvbQogICAgY292ZXIgNAogICAgcG9wbiA0CiAgICBleHRyYWN0IDIgMAogICAgZXh0cmFjdCAwIDE2IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2J1cnkgMQogICAgcHVzaGludCA4IC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9idXJ5IDIKICAgIGJ5dGVjXzAgLy8gMHgKICAgIGZyYW1lX2J1cnkgMAogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMwoKcmV2ZWFsX2Zvcl9oZWFkZXJAMTc6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDE1CiAgICA8CiAgICBieiByZXZlYWxfYWZ0ZXJfZm9yQDIzCiAgICBmcmFtZV9kaWcgMTQKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC0KICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMgogICAgaW50Y18xIC8vIDAKICAgIHVuY292ZXIgMwogICAgZGl2bW9kdwogICAgY292ZXIgMwogICAgcG9wCiAgICBmcmFtZV9idXJ5IDIKICAgIGZyYW1lX2J1cnkgMQogICAgZGlnIDEKICAgICsKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSA1CiAgICBkdXAKICAgIHB1c2hpbnQgMTEgLy8gMTEKICAgICUKICAgIGxvYWRzCiAgICBkaWcgMQogICAgY2FsbHN1YiBsaW5lYXJfc2VhcmNoCiAgICBjb3ZlciAyCiAgICBwb3AKICAgIHNlbGVjdAogICAgZnJhbWVfYnVyeSA0CiAgICBkdXAKICAgIHB1c2hpbnQgMTEgLy8gMTEKICAgICUKICAgIGR1cAogICAgZnJhbWVfYnVyeSA3CiAgICBsb2FkcwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkaWcgMQogICAgY2FsbHN1YiBsaW5lYXJfc2VhcmNoCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDYKICAgIGNvdmVyIDIKICAgIGRpZyAyCiAgICBzZWxlY3QKICAgIGl0b2IKICAgIGV4dHJhY3QgNCA0CiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIGJ6IHJldmVhbF9lbHNlX2JvZHlAMjAKICAgIGZyYW1lX2RpZyA2CiAgICBwdXNoaW50IDQgLy8gNAogICAgKwogICAgZnJhbWVfZGlnIDQKICAgIGl0b2IKICAgIGV4dHJhY3QgNCA0CiAgICByZXBsYWNlMwogICAgYiByZXZlYWxfYWZ0ZXJfaWZfZWxzZUAyMQoKcmV2ZWFsX2Vsc2VfYm9keUAyMDoKICAgIGZyYW1lX2RpZyA1CiAgICBpbnRjXzMgLy8gMzIKICAgIHNobAogICAgZnJhbWVfZGlnIDQKICAgIHwKICAgIGl0b2IKICAgIGNvbmNhdAoKcmV2ZWFsX2FmdGVyX2lmX2Vsc2VAMjE6CiAgICBmcmFtZV9kaWcgNwogICAgc3dhcAogICAgc3RvcmVzCiAgICBmcmFtZV9kaWcgMwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgYiByZXZlYWxfZm9yX2hlYWRlckAxNwoKcmV2ZWFsX2FmdGVyX2ZvckAyMzoKICAgIGZyYW1lX2RpZyAxNQogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAxNgogICAgYnl0ZWMgNCAvLyAweDAwMjIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIGxpYl9wY2cucGNnMTI4LnBjZzEyOF9pbml0KHNlZWQ6IGJ5dGVzKSAtPiB1aW50NjQsIHVpbnQ2NCwgdWludDY0LCB1aW50NjQ6CnBjZzEyOF9pbml0OgogICAgcHJvdG8gMSA0CiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50YyA4IC8vIDE0NDI2OTUwNDA4ODg5NjM0MDcKICAgIGNhbGxzdWIgX19wY2czMl9pbml0CiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50YyA5IC8vIDE0NDI2OTUwNDA4ODg5NjM0MDkKICAgIGNhbGxzdWIgX19wY2czMl9pbml0CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMiAvLyAxNgogICAgZXh0cmFjdF91aW50NjQKICAgIGludGMgMTAgLy8gMTQ0MjY5NTA0MDg4ODk2MzQxMQogICAgY2FsbHN1YiBfX3BjZzMyX2luaXQKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAyNCAvLyAyNAogICAgZXh0cmFjdF91aW50NjQKICAgIGludGMgMTEgLy8gMTQ0MjY5NTA0MDg4ODk2MzQxMwogICAgY2FsbHN1YiBfX3BjZzMyX2luaXQKICAgIHJldHN1YgoKCi8vIGxpYl9wY2cucGNnMzIuX19wY2czMl9pbml0KGluaXRpYWxfc3RhdGU6IHVpbnQ2NCwgaW5jcjogdWludDY0KSAtPiB1aW50NjQ6Cl9fcGNnMzJfaW5pdDoKICAgIHByb3RvIDIgMQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfX3BjZzMyX3N0ZXAKICAgIGZyYW1lX2RpZyAtMgogICAgYWRkdwogICAgYnVyeSAxCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX19wY2czMl9zdGVwCiAgICByZXRzdWIKCgovLyBsaWJfcGNnLnBjZzMyLl9fcGNnMzJfc3RlcChzdGF0ZTogdWludDY0LCBpbmNyOiB1aW50NjQpIC0+IHVpbnQ2NDoKX19wY2czMl9zdGVwOgogICAgcHJvdG8gMiAxCiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hpbnQgNjM2NDEzNjIyMzg0Njc5MzAwNSAvLyA2MzY0MTM2MjIzODQ2NzkzMDA1CiAgICBtdWx3CiAgICBidXJ5IDEKICAgIGZyYW1lX2RpZyAtMQogICAgYWRkdwogICAgYnVyeSAxCiAgICByZXRzdWIKCgovLyBsaWJfcGNnLnBjZzEyOC5wY2cxMjhfcmFuZG9tKHN0YXRlLjA6IHVpbnQ2NCwgc3RhdGUuMTogdWludDY0LCBzdGF0ZS4yOiB1aW50NjQsIHN0YXRlLjM6IHVpbnQ2NCwgbG93ZXJfYm91bmQ6IGJ5dGVzLCB1cHBlcl9ib3VuZDogYnl0ZXMsIGxlbmd0aDogdWludDY0KSAtPiB1aW50NjQsIHVpbnQ2NCwgdWludDY0LCB1aW50NjQsIGJ5dGVzOgpwY2cxMjhfcmFuZG9tOgogICAgcHJvdG8gNyA1CiAgICBpbnRjXzEgLy8gMAogICAgZHVwbiAyCiAgICBieXRlY18wIC8vICIiCiAgICBwdXNoYnl0ZXMgMHgwMDAwCiAgICBmcmFtZV9kaWcgLTMKICAgIGJ5dGVjXzAgLy8gMHgKICAgIGI9PQogICAgYnogcGNnMTI4X3JhbmRvbV9lbHNlX2JvZHlANwogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlY18wIC8vIDB4CiAgICBiPT0KICAgIGJ6IHBjZzEyOF9yYW5kb21fZWxzZV9ib2R5QDcKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDMKCnBjZzEyOF9yYW5kb21fZm9yX2hlYWRlckAzOgogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAtMQogICAgPAogICAgYnogcGNnMTI4X3JhbmRvbV9hZnRlcl9pZl9lbHNlQDIwCiAgICBmcmFtZV9kaWcgLTcKICAgIGZyYW1lX2RpZyAtNgogICAgZnJhbWVfZGlnIC01CiAgICBmcmFtZV9kaWcgLTQKICAgIGNhbGxzdWIgX19wY2cxMjhfdW5ib3VuZGVkX3JhbmRvbQogICAgY292ZXIgNAogICAgZnJhbWVfYnVyeSAtNAogICAgZnJhbWVfYnVyeSAtNQogICAgZnJhbWVfYnVyeSAtNgogICAgZnJhbWVfYnVyeSAtNwogICAgZnJhbWVfZGlnIDQKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgbGVuCiAgICBpbnRjXzIgLy8gMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGludGNfMiAvLyAxNgogICAgYnplcm8KICAgIHVuY292ZXIgMgogICAgYnwKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAxNgogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSA0CiAgICBmcmFtZV9kaWcgMwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgYiBwY2cxMjhfcmFuZG9tX2Zvcl9oZWFkZXJAMwoKcGNnMTI4X3JhbmRvbV9lbHNlX2JvZHlANzoKICAgIGZyYW1lX2RpZyAtMgogICAgYnl0ZWNfMCAvLyAweAogICAgYiE9CiAgICBieiBwY2cxMjhfcmFuZG9tX2Vsc2VfYm9keUA5CiAgICBmcmFtZV9kaWcgLTIKICAgIGJ5dGVjXzMgLy8gMHgwMQogICAgYj4KICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlYyA1IC8vIDB4MDEwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAogICAgYjwKICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlY18zIC8vIDB4MDEKICAgIGItCiAgICBmcmFtZV9kaWcgLTMKICAgIGI+CiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0zCiAgICBiLQogICAgZnJhbWVfYnVyeSAwCiAgICBiIHBjZzEyOF9yYW5kb21fYWZ0ZXJfaWZfZWxzZUAxMAoKcGNnMTI4X3JhbmRvbV9lbHNlX2JvZHlAOToKICAgIGZyYW1lX2RpZyAtMwogICAgcHVzaGJ5dGVzIDB4ODAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGI8CiAgICBhc3NlcnQKICAgIGJ5dGVjIDUgLy8gMHgwMTAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICBmcmFtZV9kaWcgLTMKICAgIGItCiAgICBmcmFtZV9idXJ5IDAKCnBjZzEyOF9yYW5kb21fYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNhbGxzdWIgX191aW50MTI4X3R3b3MKICAgIHN3YXAKICAgIGIlCiAgICBmcmFtZV9idXJ5IDIKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDMKCnBjZzEyOF9yYW5kb21fZm9yX2hlYWRlckAxMToKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9kaWcgLTEKICAgIDwKICAgIGJ6IHBjZzEyOF9yYW5kb21fYWZ0ZXJfZm9yQDE5CgpwY2cxMjhfcmFuZG9tX3doaWxlX3RvcEAxMzoKICAgIGZyYW1lX2RpZyAtNwogICAgZnJhbWVfZGlnIC02CiAgICBmcmFtZV9kaWcgLTUKICAgIGZyYW1lX2RpZyAtNAogICAgY2FsbHN1YiBfX3BjZzEyOF91bmJvdW5kZWRfcmFuZG9tCiAgICBkdXAKICAgIGNvdmVyIDUKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAtNAogICAgZnJhbWVfYnVyeSAtNQogICAgZnJhbWVfYnVyeSAtNgogICAgZnJhbWVfYnVyeSAtNwogICAgZnJhbWVfZGlnIDIKICAgIGI+PQogICAgYnogcGNnMTI4X3JhbmRvbV93aGlsZV90b3BAMTMKICAgIGZyYW1lX2RpZyA0CiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICBiJQogICAgZnJhbWVfZGlnIC0zCiAgICBiKwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAxNgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgaW50Y18yIC8vIDE2CiAgICBiemVybwogICAgYnwKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAxNgogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSA0CiAgICBmcmFtZV9kaWcgMwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgYiBwY2cxMjhfcmFuZG9tX2Zvcl9oZWFkZXJAMTEKCnBjZzEyOF9yYW5kb21fYWZ0ZXJfZm9yQDE5OgoKcGNnMTI4X3JhbmRvbV9hZnRlcl9pZl9lbHNlQDIwOgogICAgZnJhbWVfZGlnIC03CiAgICBmcmFtZV9kaWcgLTYKICAgIGZyYW1lX2RpZyAtNQogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgNAogICAgdW5jb3ZlciA5CiAgICB1bmNvdmVyIDkKICAgIHVuY292ZXIgOQogICAgdW5jb3ZlciA5CiAgICB1bmNvdmVyIDkKICAgIHJldHN1YgoKCi8vIGxpYl9wY2cucGNnMTI4Ll9fcGNnMTI4X3VuYm91bmRlZF9yYW5kb20oc3RhdGUuMDogdWludDY0LCBzdGF0ZS4xOiB1aW50NjQsIHN0YXRlLjI6IHVpbnQ2NCwgc3RhdGUuMzogdWludDY0KSAtPiB1aW50NjQsIHVpbnQ2NCwgdWludDY0LCB1aW50NjQsIGJ5dGVzOgpfX3BjZzEyOF91bmJvdW5kZWRfcmFuZG9tOgogICAgcHJvdG8gNCA1CiAgICBmcmFtZV9kaWcgLTQKICAgIGludGMgOCAvLyAxNDQyNjk1MDQwODg4OTYzNDA3CiAgICBjYWxsc3ViIF9fcGNnMzJfc3RlcAogICAgZHVwCiAgICAhCiAgICBpbnRjIDkgLy8gMTQ0MjY5NTA0MDg4ODk2MzQwOQogICAgc3dhcAogICAgc2hsCiAgICBmcmFtZV9kaWcgLTMKICAgIHN3YXAKICAgIGNhbGxzdWIgX19wY2czMl9zdGVwCiAgICBkdXAKICAgICEKICAgIGludGMgMTAgLy8gMTQ0MjY5NTA0MDg4ODk2MzQxMQogICAgc3dhcAogICAgc2hsCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGNhbGxzdWIgX19wY2czMl9zdGVwCiAgICBkdXAKICAgICEKICAgIGludGMgMTEgLy8gMTQ0MjY5NTA0MDg4ODk2MzQxMwogICAgc3dhcAogICAgc2hsCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIGNhbGxzdWIgX19wY2czMl9zdGVwCiAgICBmcmFtZV9kaWcgLTQKICAgIGNhbGxzdWIgX19wY2czMl9vdXRwdXQKICAgIGludGNfMyAvLyAzMgogICAgc2hsCiAgICBmcmFtZV9kaWcgLTMKICAgIGNhbGxzdWIgX19wY2czMl9vdXRwdXQKICAgIHwKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBfX3BjZzMyX291dHB1dAogICAgaW50Y18zIC8vIDMyCiAgICBzaGwKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfX3BjZzMyX291dHB1dAogICAgfAogICAgaXRvYgogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBsaWJfcGNnLnBjZzMyLl9fcGNnMzJfb3V0cHV0KHN0YXRlOiB1aW50NjQpIC0+IHVpbnQ2NDoKX19wY2czMl9vdXRwdXQ6CiAgICBwcm90byAxIDEKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAxOCAvLyAxOAogICAgc2hyCiAgICBmcmFtZV9kaWcgLTEKICAgIF4KICAgIHB1c2hpbnQgMjcgLy8gMjcKICAgIHNocgogICAgaW50YyA0IC8vIDQyOTQ5NjcyOTUKICAgICYKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCA1OSAvLyA1OQogICAgc2hyCiAgICBkdXAKICAgIH4KICAgIGludGNfMCAvLyAxCiAgICBhZGR3CiAgICBidXJ5IDEKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHNocgogICAgc3dhcAogICAgcHVzaGludCAzMSAvLyAzMQogICAgJgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBzaGwKICAgIGludGMgNCAvLyA0Mjk0OTY3Mjk1CiAgICAmCiAgICB8CiAgICByZXRzdWIKCgovLyBsaWJfcGNnLnBjZzEyOC5fX3VpbnQxMjhfdHdvcyh2YWx1ZTogYnl0ZXMpIC0+IGJ5dGVzOgpfX3VpbnQxMjhfdHdvczoKICAgIHByb3RvIDEgMQogICAgZnJhbWVfZGlnIC0xCiAgICBifgogICAgYnl0ZWNfMyAvLyAweDAxCiAgICBiKwogICAgcHVzaGJ5dGVzIDB4ZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmYKICAgIGImCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudmVyaWZpYWJsZV9zaHVmZmxlLmNvbnRyYWN0LmxpbmVhcl9zZWFyY2goYmluX2xpc3Q6IGJ5dGVzLCBrZXk6IHVpbnQ2NCkgLT4gdWludDY0LCB1aW50NjQsIHVpbnQ2NDoKbGluZWFyX3NlYXJjaDoKICAgIHByb3RvIDIgMwogICAgYnl0ZWNfMCAvLyAiIgogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGludGNfMSAvLyAwCgpsaW5lYXJfc2VhcmNoX2Zvcl9oZWFkZXJAMToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogbGluZWFyX3NlYXJjaF9hZnRlcl9mb3JANgogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgMgogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICBpbnRjXzMgLy8gMzIKICAgIHNocgogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYnogbGluZWFyX3NlYXJjaF9hZnRlcl9pZl9lbHNlQDQKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjIDQgLy8gNDI5NDk2NzI5NQogICAgJgogICAgaW50Y18wIC8vIDEKICAgIGZyYW1lX2RpZyAyCiAgICB1bmNvdmVyIDIKICAgIHVuY292ZXIgNQogICAgdW5jb3ZlciA1CiAgICB1bmNvdmVyIDUKICAgIHJldHN1YgoKbGluZWFyX3NlYXJjaF9hZnRlcl9pZl9lbHNlQDQ6CiAgICBmcmFtZV9kaWcgMgogICAgcHVzaGludCA4IC8vIDgKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgYiBsaW5lYXJfc2VhcmNoX2Zvcl9oZWFkZXJAMQoKbGluZWFyX3NlYXJjaF9hZnRlcl9mb3JANjoKICAgIGludGNfMSAvLyAwCiAgICBkdXBuIDIKICAgIHVuY292ZXIgNQogICAgdW5jb3ZlciA1CiAgICB1bmNvdmVyIDUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52ZXJpZmlhYmxlX3NodWZmbGUuY29udHJhY3QuVmVyaWZpYWJsZVNodWZmbGUudXBkYXRlKCkgLT4gdm9pZDoKdXBkYXRlOgogICAgcHJvdG8gMCAwCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBpcyBub3QgdGhlIGNyZWF0b3IKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52ZXJpZmlhYmxlX3NodWZmbGUuY29udHJhY3QuVmVyaWZpYWJsZVNodWZmbGUuZGVsZXRlKCkgLT4gdm9pZDoKZGVsZXRlOgogICAgcHJvdG8gMCAwCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBpcyBub3QgdGhlIGNyZWF0b3IKICAgIHJldHN1Ygo=",
         "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMudmVyaWZpYWJsZV9zaHVmZmxlLmNvbnRyYWN0LlZlcmlmaWFibGVTaHVmZmxlLmNsZWFyX3N0YXRlX3Byb2dyYW06CiAgICBwdXNoaW50IDEgLy8gMQogICAgcmV0dXJuCg=="
     },
     "state": {
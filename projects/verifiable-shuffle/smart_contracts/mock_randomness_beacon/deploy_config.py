@@ -38,8 +38,12 @@ def deploy(
         user_data = b""
         randomness = app_client.must_get(round=round_arg, user_data=user_data)
         logger.info(
-            f"Called must_get on {app_spec.contract.name} ({app_client.app_id}) "
-            f"with {round_arg = }, {user_data = !r}, received: {randomness.return_value!r}"
+            "Called must_get on %s (%s) with round_arg = %s, user_data = %r, received: %r",
+            app_spec.contract.name,
+            app_client.app_id,
+            round_arg,
+            user_data,
+            randomness.return_value,
         )
     else:
         logger.info("Not on LocalNet, nothing to do.")
@@ -6,7 +6,44 @@ OPUP: Final[str] = "VERIFIABLE_SHUFFLE_OPUP"
 SAFETY_GAP: Final[str] = "SAFETY_ROUND_GAP"
 
 # Constants
-COMMIT_SINGLE_WINNER_OP_COST: Final[int] = 600
 REVEAL_SINGLE_WINNER_OP_COST: Final[int] = 500
-LOG_PRECISION: Final[int] = 16
 BINS: Final[int] = 11
+
+# Largest #participants such that #participants! / (#participants - #winners)! <= 2^128, indexed by #winners - 1.
+# Each entry is a big-endian uint32 capped at the largest admissible #participants.
+MAX_PARTICIPANTS_BY_WINNERS: Final[str] = (
+    "FFFFFFFF"  # 1 -> 4294967295
+    "FFFFFFFF"  # 2 -> 4294967295
+    "FFFFFFFF"  # 3 -> 4294967295
+    "FFFFFFFF"  # 4 -> 4294967295
+    "03080C02"  # 5 -> 50859010
+    "00285148"  # 6 -> 2642248
+    "0004E048"  # 7 -> 319560
+    "00010003"  # 8 -> 65539
+    "00004AAC"  # 9 -> 19116
+    "00001BE0"  # 10 -> 7136
+    "00000C74"  # 11 -> 3188
+    "0000065F"  # 12 -> 1631
+    "0000039E"  # 13 -> 926
+    "0000023B"  # 14 -> 571
+    "00000179"  # 15 -> 377
+    "00000107"  # 16 -> 263
+    "000000C0"  # 17 -> 192
+    "00000092"  # 18 -> 146
+    "00000073"  # 19 -> 115
+    "0000005E"  # 20 -> 94
+    "0000004E"  # 21 -> 78
+    "00000043"  # 22 -> 67
+    "0000003A"  # 23 -> 58
+    "00000034"  # 24 -> 52
+    "0000002F"  # 25 -> 47
+    "0000002B"  # 26 -> 43
+    "00000028"  # 27 -> 40
+    "00000026"  # 28 -> 38
+    "00000024"  # 29 -> 36
+    "00000023"  # 30 -> 35
+    "00000022"  # 31 -> 34
+    "00000022"  # 32 -> 34
+    "00000022"  # 33 -> 34
+    "00000022"  # 34 -> 34
+)
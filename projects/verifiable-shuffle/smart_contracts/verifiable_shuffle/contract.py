@@ -69,10 +69,10 @@ import smart_contracts.verifiable_shuffle.errors as err
 
 # However, 2^128 is an enormous number of participants and would allow for a single winner at most.
 # It would also force us to use BigUInt math everywhere and that's expensive.
-# If participants was a 64-bit number, it would allow for 2 winners at most, we could use native uint64 math,
-#  but it would create issues with binary_logarithm for reasons stated in the function's docstring.
-# We are going to assume that participants is a 32-bit number because it allows 4 winners in the worst case,
-#  native uint64 math and no issues with binary_logarithm.
+# If participants was a 64-bit number, it would allow for 2 winners at most and we could use native uint64 math,
+#  but the safety table below would need twice the space.
+# We are going to assume that participants is a 32-bit number because it allows 4 winners in the worst case
+#  and native uint64 math.
 
 # For any #winners == k, the number of possible k-permutations is minimized by n == k.
 # Since:
@@ -83,6 +83,11 @@ import smart_contracts.verifiable_shuffle.errors as err
 #  with a 128-bit seed.
 # Therefore, k fits in an 8-bit integer.
 
+# For any fixed k, the number of k-permutations grows with n.
+# This means that the admissible pairs are fully described by the largest safe n for each k in [1, 34].
+# Those bounds are computed offline with exact integer math and the contract only needs to look them up.
+# See cfg.MAX_PARTICIPANTS_BY_WINNERS.
+
 
 class Commitment(arc4.Struct, kw_only=True):
     tx_id: arc4.StaticArray[arc4.Byte, Literal[32]]
@@ -96,120 +101,6 @@ class Reveal(arc4.Struct, kw_only=True):
     winners: arc4.DynamicArray[arc4.UInt32]
 
 
-# TODO: We need more error analysis given the bits used for n and the bits of the fractional
-#  part we wish to compute.
-# It was already attempted to re-write this function in terms of BigUInt math to allow for
-#  larger arguments.
-# That version was much more expensive from an opcode budget perspective.
-# If today's precision is acceptable and within reasonable opcode economy, it's best to leave it as is.
-# https://mathsanew.com/articles/computing_logarithm_bit_by_bit.pdf
-# https://en.wikipedia.org/wiki/Binary_logarithm#Iterative_approximation
-@subroutine
-def binary_logarithm(n: UInt64, m: UInt64) -> UInt64:
-    """Approximates the binary logarithm of an integer using an iterative approach.
-
-    This function computes the integer part of the logarithm by looking at the Most Set Bit (MSB).
-    The fractional part of the logarithm is approximated by discovering one bit with each iteration.
-
-    The underlying property that we are leveraging is that log(x^2) == 2log(x), which means we
-     can iteratively square the argument and discover the next fractional bit of the logarithm.
-
-    This algorithm is sensitive to the precision of the input integer. The more bits of the argument,
-     the better the result.
-    The integer can be divided by 2 with each iteration, in which case we lose one bit of information.
-    Squaring doesn't add any bit of information even if it makes the number larger.
-    For this reason, we try to use this function with the largest uint64 possible.
-
-    The algorithm assumes that n is divided by the largest power of two it can take before computing
-     the fractional part of the logarithm (this will always be 2^(integer part)).
-    Stated alternatively, the fractional part assumes the input is between 1 and 2 (not included).
-    It's at least one because we are computing the logarithm of a natural number.
-    It's less than two because, if it wasn't, it could've been divided by a larger power of two.
-
-    As we don't have access to floats and would like to use the cheapest AVM math available,
-     we can't divide n by the largest power of two it can take.
-    Instead, we will interpret n as a fixed point number with an implicit scaling factor of that same
-     largest power of two.
-    We can safely and cheaply compute any math involving 64-bit fix point numbers thanks to wide arithmetic.
-
-    It should be noted that squaring any number between (1, 2] could result in any number between (1, 4].
-    Therefore, for n >= sqrt(2) and scaling factor = 2^64, the result will be a 65-bit number.
-    Stated alternatively, if n >= sqrt(2) then n^2 >= 2 which means the result needs 65 bits to fit.
-    63 bits for the fractional part and 2 bits for the integer part.
-    Everytime n >= 2, we divide it by 2 so we never exceed 65 bits ever.
-
-    With all this in mind, the argument to this function should be the largest integer that fits into 63 bits.
-
-    Args:
-        n: The integer that is the argument of the binary logarithm
-        m: The numer of iterations to compute the fractional part or, equivalently,
-            the number of bits to compute of the fractional part
-
-    Returns:
-        A fixed point number with an implicit scaling factor of 2^m.
-    """
-    integer_component = op.bitlen(n) - 1
-
-    # If n was a float at this point, this would be:
-    # if n == 1:
-    if n == (1 << integer_component):
-        return integer_component << m
-
-    fractional_component = UInt64(0)
-    for _i in urange(m):
-        fractional_component <<= 1
-        # n *= n
-        square_high, square_low = op.mulw(n, n)
-        n = op.divw(square_high, square_low, 1 << integer_component)
-        # if n >= 2:
-        if n >= (2 << integer_component):
-            fractional_component |= 1
-            # n /= 2
-            n >>= 1
-
-    return (integer_component << m) | fractional_component
-
-
-@subroutine
-def k_permutation_logarithm(n: UInt64, k: UInt64, m: UInt64) -> UInt64:
-    """Finds a numerically stable way to compute the binary logarithm of the #k-permutations.
-
-    Recall that:
-    log2(n! / (n-k)!) = log2(n * (n-1) * ... * (n-k+1)) = log2(n) + log2(n-1) + ... + log2(n-k+1)
-
-    For reasons highlighted in the binary_logarithm docstring, we want to call it with the largest integer
-     that fits in 63 bits.
-
-    Following from the log laws:
-    log2(n) + ... + log2(n-3) = log2(n * (n-1)) + log2((n-2) * (n-3))
-
-    This loop will do the product of the consecutive integers until it's too big and only then compute the binary log.
-    Also, this allows us to reduce the number of calls to binary_logarithm.
-
-    Args:
-        n: Size of the set to permute
-        k: Length of the k-permutation
-        m: The numer of iterations to compute the fractional part or, equivalently,
-            the number of bits to compute of the fractional part
-
-    Returns:
-        A fixed point number with an implicit scaling factor of 2^m.
-    """
-    largest_log_arg = UInt64(1)
-    summation = UInt64(0)
-
-    for i in urange(n - k + 1, n + 1):
-        overflow, low = op.mulw(largest_log_arg, i)
-        if overflow or op.bitlen(low) == 64:
-            summation += binary_logarithm(largest_log_arg, m)
-            largest_log_arg = i
-        else:
-            largest_log_arg *= i
-    summation += binary_logarithm(largest_log_arg, m)
-
-    return summation
-
-
 class VerifiableShuffle(ARC4Contract, scratch_slots=(urange(cfg.BINS),)):
     def __init__(self) -> None:
         self.commitment = LocalState(Commitment)
@@ -247,17 +138,10 @@ class VerifiableShuffle(ARC4Contract, scratch_slots=(urange(cfg.BINS),)):
         assert 2 <= participants.native, err.PARTICIPANTS_BOUND
         assert winners.native <= participants.native, err.INPUT_SOUNDNESS
 
-        inner_opup_calls = (
-            winners.native * UInt64(cfg.COMMIT_SINGLE_WINNER_OP_COST)
-        ) // 700 + 1
-        for _i in urange(inner_opup_calls):
-            itxn.ApplicationCall(app_id=TemplateVar[Application](cfg.OPUP)).submit()
-
-        assert k_permutation_logarithm(
-            participants.native,
-            winners.native,
-            UInt64(cfg.LOG_PRECISION),
-        ) <= (128 << UInt64(cfg.LOG_PRECISION)), err.SAFE_SIZE
+        assert participants.native <= op.extract_uint32(
+            Bytes.from_hex(cfg.MAX_PARTICIPANTS_BY_WINNERS),
+            (winners.native - 1) * 4,
+        ), err.SAFE_SIZE
 
         self.commitment[Txn.sender] = Commitment(
             tx_id=arc4.StaticArray[arc4.Byte, Literal[32]].from_bytes(Txn.tx_id),
@@ -283,40 +167,88 @@ class VerifiableShuffle(ARC4Contract, scratch_slots=(urange(cfg.BINS),)):
             app_id=TemplateVar[Application](cfg.RANDOMNESS_BEACON).id,
         )
 
-        for i in urange(cfg.BINS):
-            op.Scratch.store(i, Bytes())
-
         inner_opup_calls = (
             committed_winners * UInt64(cfg.REVEAL_SINGLE_WINNER_OP_COST)
         ) // 700 + 1
         for _i in urange(inner_opup_calls):
             itxn.ApplicationCall(app_id=TemplateVar[Application](cfg.OPUP)).submit()
 
+        state = pcg128_init(vrf_output.native)
+
+        # With a single winner, the shuffle is just one draw in [0, participants) and nothing is ever swapped.
+        # This is the same number that the general path would produce, we just skip the dictionary.
+        if committed_winners == 1:
+            state, sequence = pcg128_random(
+                state,
+                BigUInt(0),
+                BigUInt(committed_participants),
+                UInt64(1),
+            )
+            return Reveal(
+                commitment_tx_id=commitment.tx_id.copy(),
+                winners=arc4.DynamicArray[arc4.UInt32].from_bytes(
+                    arc4.UInt16(1).bytes
+                    + arc4.UInt32(op.extract_uint64(sequence[0].bytes, 8)).bytes
+                ),
+            )
+
+        for i in urange(cfg.BINS):
+            op.Scratch.store(i, Bytes())
+
         # Knuth shuffle.
         # We don't create a pre-initialized array of elements from 0 to n-1 because
         #  that could easily exceed the stack element size limit.
         # Instead, we assume that at position i lies the number i.
         # Where that element has been changed, we will look it up in a dict-like data structure based on scratch space.
 
-        # We want to stop after "winners" iterations unless "winners" == "participants"
-        #  in which case we want to stop at "winners" - 1.
-        # We never need to shuffle the last element because it would just end up in the same position.
-        n_shuffles = (
-            committed_winners
-            # We know that, by construction, "winners" <= "participants".
-            if committed_winners < committed_participants
-            else committed_winners - 1
+        # Each shuffle only needs an offset in [0, participants - i) but a single draw from pcg128 carries
+        #  128 bits of randomness.
+        # The product of all the ranges is the number of k-permutations which is strictly less than 2^128.
+        # This holds only because commit admits at most cfg.MAX_PARTICIPANTS_BY_WINNERS[winners - 1] participants
+        #  and every entry of that table keeps the product at most 2^128 (a product of consecutive integers is
+        #  never a power of two this large).
+        # Any change to the table must keep that invariant, which tests/max_participants_by_winners_test.py checks.
+        # Therefore, we draw a single number in [0, product) and the offsets are its digits in the mixed radix
+        #  (participants, participants - 1, ..., participants - winners + 1).
+        # Since the mapping between [0, product) and the tuples of offsets is a bijection, each tuple is
+        #  equally likely as long as the draw is uniform (pcg128_random takes care of that with rejection).
+        # The product is kept as a 128-bit (high, low) pair so that we can compute it with native wide math.
+        # Should the safety check ever be loosened, the native * and + on the high word would panic before we draw
+        #  anything rather than silently truncating the upper bound of the draw.
+        shuffle_range_high = UInt64(0)
+        shuffle_range_low = UInt64(1)
+        for i in urange(committed_winners):
+            carry, shuffle_range_low = op.mulw(
+                shuffle_range_low, committed_participants - i
+            )
+            shuffle_range_high = (
+                shuffle_range_high * (committed_participants - i) + carry
+            )
+
+        state, sequence = pcg128_random(
+            state,
+            BigUInt(0),
+            BigUInt.from_bytes(
+                op.itob(shuffle_range_high) + op.itob(shuffle_range_low)
+            ),
+            UInt64(1),
         )
-        state = pcg128_init(vrf_output.native)
-        winners = arc4.DynamicArray[arc4.UInt32]()
-        for i in urange(n_shuffles):
-            state, sequence = pcg128_random(
-                state,
-                BigUInt(i),
-                BigUInt(committed_participants),
-                UInt64(1),
+        # The draw is a 128-bit number so we can peel off the digits with native wide math
+        #  instead of BigUInt math.
+        draw_high = op.extract_uint64(sequence[0].bytes, 0)
+        draw_low = op.extract_uint64(sequence[0].bytes, 8)
+
+        # When "winners" == "participants", the last shuffle has a range of only 1 possibility.
+        # We don't need to special case it: its digit is always 0 and a[i] is just read from the dictionary.
+
+        # We collect the ARC4 encoded winners and add the length header only once at the end.
+        winners = Bytes()
+        for i in urange(committed_winners):
+            # draw, offset = divmod(draw, participants - i)
+            draw_high, draw_low, _offset_high, offset = op.divmodw(
+                draw_high, draw_low, 0, committed_participants - i
             )
-            j = op.extract_uint32(sequence[0].bytes, 12)
+            j = i + offset
 
             # Here we "just" need to swap a[i] with a[j].
             # a[i] and a[j] have possibly already been written to so we need to look them
@@ -326,7 +258,8 @@ class VerifiableShuffle(ARC4Contract, scratch_slots=(urange(cfg.BINS),)):
             )
             i_value = i_maybe if i_found else i
 
-            j_bin = op.Scratch.load_bytes(j % cfg.BINS)
+            j_slot = j % cfg.BINS
+            j_bin = op.Scratch.load_bytes(j_slot)
             j_found, j_pos, j_maybe = linear_search(j_bin, j)
             j_value = j_maybe if j_found else j
 
@@ -334,37 +267,29 @@ class VerifiableShuffle(ARC4Contract, scratch_slots=(urange(cfg.BINS),)):
             # We can just append to the actual winners array because index i will never be
             #  read or written to ever again.
             # For the same reason, we don't need to update the key i in the dictionary.
-            winners.append(arc4.UInt32(j_value))
+            winners += arc4.UInt32(j_value).bytes
 
             # a[j] <- a[i]
             if j_found:
                 j_bin = op.replace(j_bin, j_pos + 4, arc4.UInt32(i_value).bytes)
             else:
-                j_bin += arc4.UInt32(j).bytes + arc4.UInt32(i_value).bytes
-            op.Scratch.store(j % cfg.BINS, j_bin)
-
-        # When #participants == #winners, we skip the last iteration because:
-        # - It swaps the element with itself which is pointless.
-        # - pcg128 would error when asked to generate a number with a range of only 1 possibility.
-        # In such case, we just want to read it from the dictionary and append it.
-        if committed_participants == committed_winners:
-            key = committed_winners - UInt64(1)
-            found, _pos, last_winner = linear_search(
-                op.Scratch.load_bytes(key % cfg.BINS),
-                key,
-            )
-            winners.append(arc4.UInt32(last_winner if found else key))
+                # Both key and value fit in 32 bits so the entry is encoded in a single word.
+                j_bin += op.itob(j << 32 | i_value)
+            op.Scratch.store(j_slot, j_bin)
 
         return Reveal(
             commitment_tx_id=commitment.tx_id.copy(),
-            winners=winners.copy(),
+            winners=arc4.DynamicArray[arc4.UInt32].from_bytes(
+                arc4.UInt16(committed_winners).bytes + winners
+            ),
         )
 
 
 @subroutine
 def linear_search(bin_list: Bytes, key: UInt64) -> Tuple[bool, UInt64, UInt64]:
     for i in urange(UInt64(0), bin_list.length, UInt64(8)):
-        bin_key = op.extract_uint32(bin_list, i)
-        if bin_key == key:
-            return True, i, op.extract_uint32(bin_list, i + 4)
+        # Each entry is a single word with the key in the high half and the value in the low half.
+        entry = op.extract_uint64(bin_list, i)
+        if entry >> 32 == key:
+            return True, i, entry & 0xFFFFFFFF
     return False, UInt64(0), UInt64(0)
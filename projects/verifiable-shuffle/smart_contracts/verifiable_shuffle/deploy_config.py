@@ -14,7 +14,13 @@ from algokit_utils.deploy import get_creator_apps
 from algosdk.constants import min_txn_fee
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import (
+    RetryError,
+    retry,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,12 +50,19 @@ def deploy(
         indexer_client=indexer_client,
     )
 
-    @retry(stop=stop_after_attempt(10), wait=wait_fixed(2))  # type: ignore[misc]
-    def get_creator_app_with_retry(contract_name: str) -> int:
-        return get_creator_apps(indexer_client, deployer).apps[contract_name].app_id
+    @retry(  # type: ignore[misc]
+        stop=stop_after_attempt(10),
+        wait=wait_exponential(multiplier=0.25, max=4) + wait_random(0, 0.5),
+    )
+    def get_creator_app_ids_with_retry(contract_names: list[str]) -> list[int]:
+        # A single indexer query serves all the lookups and is retried until all of them are found.
+        creator_apps = get_creator_apps(indexer_client, deployer).apps
+        return [creator_apps[name].app_id for name in contract_names]
 
     if is_localnet(algod_client):
-        randomness_beacon = get_creator_app_with_retry(MOCK_RB_APP_SPEC.contract.name)
+        randomness_beacon, verifiable_shuffle_opup = get_creator_app_ids_with_retry(
+            [MOCK_RB_APP_SPEC.contract.name, OPUP_SPEC.contract.name]
+        )
     else:
         randomness_beacon_from_env = os.environ.get(cfg.RANDOMNESS_BEACON)
         if randomness_beacon_from_env is None:
@@ -57,11 +70,14 @@ def deploy(
                 f"{cfg.RANDOMNESS_BEACON} environment variable not set or not found in localnet"
             )
         randomness_beacon = int(randomness_beacon_from_env)
+        (verifiable_shuffle_opup,) = get_creator_app_ids_with_retry(
+            [OPUP_SPEC.contract.name]
+        )
 
-    verifiable_shuffle_opup = get_creator_app_with_retry(OPUP_SPEC.contract.name)
-    safety_gap = os.environ.get(cfg.SAFETY_GAP)
-    if safety_gap is None:
+    safety_gap_from_env = os.environ.get(cfg.SAFETY_GAP)
+    if safety_gap_from_env is None:
         raise Exception(f"{cfg.SAFETY_GAP} environment variable not set")
+    safety_gap = int(safety_gap_from_env)
 
     app_client.deploy(
         on_update=algokit_utils.OnUpdate.UpdateApp,
@@ -69,7 +85,7 @@ def deploy(
         template_values={
             cfg.RANDOMNESS_BEACON: randomness_beacon,
             cfg.OPUP: verifiable_shuffle_opup,
-            cfg.SAFETY_GAP: int(safety_gap),
+            cfg.SAFETY_GAP: safety_gap,
         },
     )
 
@@ -85,49 +101,68 @@ def deploy(
 
     sp = algod_client.suggested_params()
     sp.flat_fee = True
-    sp.fee = ((cfg.COMMIT_SINGLE_WINNER_OP_COST // 700) + 2) * min_txn_fee
+    sp.fee = min_txn_fee
     commitment = app_client.opt_in_commit(
-        delay=int(safety_gap),
+        delay=safety_gap,
         participants=2,
         winners=1,
         transaction_parameters=TransactionParameters(
             signer=user.signer,
             sender=user.address,
             suggested_params=sp,
-            foreign_apps=[verifiable_shuffle_opup],
         ),
     )
     logger.info(
-        f"Called opt_in_commit in {commitment.tx_id} on {app_spec.contract.name} ({app_client.app_id}) "
-        f"with participants = 2, winners = 1, received: {commitment.return_value} "
+        "Called opt_in_commit in %s on %s (%s) with participants = 2, winners = 1, received: %s",
+        commitment.tx_id,
+        app_spec.contract.name,
+        app_client.app_id,
+        commitment.return_value,
     )
 
+    # Suggested params stay valid for far longer than the retries below so we fetch them only once.
+    reveal_sp = algod_client.suggested_params()
+    reveal_sp.flat_fee = True
+    # The outer call, the randomness beacon call and the opup calls for the single winner.
+    reveal_sp.fee = ((cfg.REVEAL_SINGLE_WINNER_OP_COST // 700) + 3) * min_txn_fee
+
     # Even though delay=1, we still need to retry this transaction a couple of times because
     #  we could be waiting for the VRF off-the-chain service to upload the VRF result to the
     #  Randomness Beacon.
-    @retry(stop=stop_after_attempt(21), wait=wait_fixed(3))  # type: ignore[misc]
+    # The backoff keeps the first attempts quick for when the VRF result is already there and the jitter
+    #  avoids concurrent deployments retrying in lockstep.
+    @retry(  # type: ignore[misc]
+        stop=stop_after_attempt(21),
+        wait=wait_exponential(multiplier=0.5, max=8) + wait_random(0, 1),
+    )
     def reveal_with_retry() -> algokit_utils.ABITransactionResponse[Reveal]:
-        sp = algod_client.suggested_params()
-        sp.flat_fee = True
-        sp.fee = ((cfg.REVEAL_SINGLE_WINNER_OP_COST // 700) + 3) * min_txn_fee
-
         return app_client.close_out_reveal(
             transaction_parameters=TransactionParameters(
                 signer=user.signer,
                 sender=user.address,
-                suggested_params=sp,
+                suggested_params=reveal_sp,
                 foreign_apps=[randomness_beacon, verifiable_shuffle_opup],
             )
         )
 
     try:
         reveal = reveal_with_retry()
-    except:
-        app_client.clear_state()
+    except RetryError:
+        # Once every attempt has failed, the commitment would be left dangling.
+        # It belongs to the user (not the deployer, who never opted in) so that's whose local state we need to clear.
+        app_client.clear_state(
+            transaction_parameters=TransactionParameters(
+                signer=user.signer, sender=user.address
+            )
+        )
         raise
 
-    logger.info(
-        f"Called close_out_reveal on {app_spec.contract.name} ({app_client.app_id}) "
-        f"received: Commitment ID: {base64.b32encode(bytes(reveal.return_value.commitment_tx_id))!r} "
-        f"and winners: {reveal.return_value.winners}"
-    )
+    # Encoding the commitment transaction ID is only worth it if the message is going to be logged.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Called close_out_reveal on %s (%s) received: Commitment ID: %r and winners: %s",
+            app_spec.contract.name,
+            app_client.app_id,
+            base64.b32encode(bytes(reveal.return_value.commitment_tx_id)),
+            reveal.return_value.winners,
+        )
@@ -49,4 +49,6 @@ def deploy(
             signer=user.signer, sender=user.address
         )
     )
-    logger.info(f"Called bare NoOp on {app_spec.contract.name} ({app_client.app_id}) ")
+    logger.info(
+        "Called bare NoOp on %s (%s)", app_spec.contract.name, app_client.app_id
+    )
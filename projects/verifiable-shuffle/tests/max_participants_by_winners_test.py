@@ -0,0 +1,25 @@
+import math
+
+import pytest
+
+import smart_contracts.verifiable_shuffle.config as cfg
+
+MAX_PARTICIPANTS = 2**32 - 1
+MAX_WINNERS = 34
+
+
+def test_table_size() -> None:
+    """Makes sure that there is exactly one uint32 entry for each admissible #winners."""
+    assert len(bytes.fromhex(cfg.MAX_PARTICIPANTS_BY_WINNERS)) == MAX_WINNERS * 4
+
+
+@pytest.mark.parametrize("winners", range(1, MAX_WINNERS + 1))
+def test_max_participants_by_winners(winners: int) -> None:
+    """Makes sure that each entry is the largest #participants whose #k-permutations fit in 128 bits."""
+    table = bytes.fromhex(cfg.MAX_PARTICIPANTS_BY_WINNERS)
+    max_participants = int.from_bytes(table[(winners - 1) * 4 : winners * 4])
+
+    assert winners <= max_participants <= MAX_PARTICIPANTS
+    assert math.perm(max_participants, winners) <= 2**128
+    if max_participants < MAX_PARTICIPANTS:
+        assert math.perm(max_participants + 1, winners) > 2**128
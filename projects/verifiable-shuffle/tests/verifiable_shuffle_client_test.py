@@ -1,6 +1,7 @@
 import base64
+import copy
 import hashlib
-from typing import List, Tuple
+from typing import Iterator, List, Literal, Tuple
 
 import algokit_utils
 import pytest
@@ -15,6 +16,8 @@ from algokit_utils.beta.account_manager import AddressAndSigner
 from algokit_utils.beta.algorand_client import AlgorandClient
 from algokit_utils.config import config
 from algosdk.constants import min_txn_fee
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import SuggestedParams
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 
@@ -31,6 +34,9 @@ from smart_contracts.artifacts.verifiable_shuffle_opup.verifiable_shuffle_opup_c
     VerifiableShuffleOpupClient,
 )
 
+# The expected sequences in test_sequence depend on this fixed beacon output.
+BEACON_OUTPUT = hashlib.sha3_256(b"NOT-SO-RANDOM-DATA").digest()
+
 
 @pytest.fixture(scope="session")
 def mock_randomness_beacon_deployment(
@@ -50,9 +56,7 @@ def mock_randomness_beacon_deployment(
     return client.deploy(
         on_schema_break=algokit_utils.OnSchemaBreak.Fail,
         on_update=algokit_utils.OnUpdate.AppendApp,
-        template_values={
-            cfg_rb.OUTPUT: hashlib.sha3_256(b"NOT-SO-RANDOM-DATA").digest()
-        },
+        template_values={cfg_rb.OUTPUT: BEACON_OUTPUT},
     )
 
 
@@ -80,14 +84,12 @@ def opup_deployment(
 @pytest.fixture(scope="session")
 def verifiable_shuffle_client(
     algod_client: AlgodClient,
-    indexer_client: IndexerClient,
     mock_randomness_beacon_deployment: DeployResponse,
     opup_deployment: DeployResponse,
 ) -> VerifiableShuffleClient:
     client = VerifiableShuffleClient(
         algod_client,
         creator=get_localnet_default_account(algod_client),
-        indexer_client=indexer_client,
         template_values={
             cfg_vs.RANDOMNESS_BEACON: mock_randomness_beacon_deployment.app.app_id,
             cfg_vs.OPUP: opup_deployment.app.app_id,
@@ -113,6 +115,70 @@ def user_account(algorand_client: AlgorandClient) -> AddressAndSigner:
     return acct
 
 
+# A test that stops between commit and reveal would leave the shared account opted in, making every following
+#  commit fail.
+@pytest.fixture(autouse=True)
+def clear_leftover_commitment(
+    algod_client: AlgodClient,
+    verifiable_shuffle_client: VerifiableShuffleClient,
+    user_account: AddressAndSigner,
+) -> Iterator[None]:
+    yield
+
+    try:
+        algod_client.account_application_info(
+            user_account.address, verifiable_shuffle_client.app_id
+        )
+    except AlgodHTTPError as e:
+        # Only a 404 means not opted in, i.e. the test already cleaned up after itself.
+        # Any other failure would leave the account opted in and must not be mistaken for that.
+        if e.code != 404:
+            raise
+        return
+
+    verifiable_shuffle_client.clear_state(
+        transaction_parameters=TransactionParameters(
+            signer=user_account.signer, sender=user_account.address
+        )
+    )
+
+
+# Fetched once per test. Sharing them across tests would give identical calls from different scenarios (e.g. two
+#  single-winner reveals) the same transaction ID.
+@pytest.fixture
+def suggested_params(algod_client: AlgodClient) -> SuggestedParams:
+    sp = algod_client.suggested_params()
+    sp.flat_fee = True
+    # Enough for every call but the reveal, which pays for its inner transactions on a copy.
+    sp.fee = min_txn_fee
+
+    return sp
+
+
+def reveal_fee(winners: int) -> int:
+    # The outer call, the randomness beacon call and the opup calls for all the winners.
+    return ((winners * cfg_vs.REVEAL_SINGLE_WINNER_OP_COST) // 700 + 3) * min_txn_fee
+
+
+def commit_and_clear(
+    client: VerifiableShuffleClient,
+    user: AddressAndSigner,
+    sp: SuggestedParams,
+    participants: int,
+    winners: int,
+) -> None:
+    # The successful commit and the cleanup go out as a single group.
+    transaction_parameters = TransactionParameters(
+        signer=user.signer, sender=user.address, suggested_params=sp
+    )
+    client.compose().opt_in_commit(
+        delay=1,
+        participants=participants,
+        winners=winners,
+        transaction_parameters=transaction_parameters,
+    ).clear_state(transaction_parameters=transaction_parameters).execute()
+
+
 # These test cases are not derived from a reference implementation but rather just used to detect instability
 #  in the algorithm.
 @pytest.mark.parametrize(
@@ -120,28 +186,66 @@ def user_account(algorand_client: AlgorandClient) -> AddressAndSigner:
     [
         (2, 1, [1]),
         (2, 2, [1, 0]),
-        (5, 2, [3, 1]),
-        (10, 3, [3, 0, 4]),
-        (10, 9, [3, 0, 4, 1, 5, 9, 2, 6, 7]),
-        (10, 10, [3, 0, 4, 1, 5, 9, 2, 6, 7, 8]),
+        (5, 2, [3, 0]),
+        (10, 3, [3, 6, 8]),
+        (10, 9, [3, 6, 8, 0, 9, 4, 7, 1, 2]),
+        (10, 10, [3, 6, 8, 0, 9, 4, 7, 1, 2, 5]),
         (80, 1, [33]),
-        (80, 5, [33, 19, 8, 24, 21]),
+        (80, 5, [33, 47, 74, 6, 48]),
         (
             80,
             20,
-            [33, 19, 8, 24, 21, 54, 13, 7, 6, 14, 1, 60, 23, 41, 74, 69, 35, 2, 42, 77],
+            [
+                33,
+                47,
+                74,
+                6,
+                48,
+                1,
+                57,
+                69,
+                23,
+                38,
+                37,
+                45,
+                66,
+                54,
+                3,
+                58,
+                18,
+                43,
+                71,
+                53,
+            ],
         ),
         (
             2**8 - 1,
             16,
-            [53, 159, 5, 129, 74, 3, 125, 206, 248, 102, 89, 133, 120, 85, 126, 164],
+            [
+                53,
+                117,
+                16,
+                189,
+                97,
+                176,
+                167,
+                127,
+                54,
+                116,
+                212,
+                104,
+                182,
+                235,
+                115,
+                146,
+            ],
         ),
-        (2**16 - 1, 8, [65078, 39277, 24201, 18093, 24360, 54079, 9977, 5054]),
-        (2**32 - 2, 4, [146095707, 3969517344, 3683389088, 196699749]),
+        (2**16 - 1, 8, [65078, 25774, 33819, 31466, 58970, 41971, 41406, 58956]),
+        (2**32 - 2, 4, [146095707, 405026398, 330496902, 3861672780]),
     ],
 )
 def test_sequence(
-    algorand_client: AlgorandClient,
+    suggested_params: SuggestedParams,
     verifiable_shuffle_client: VerifiableShuffleClient,
     mock_randomness_beacon_deployment: DeployResponse,
     opup_deployment: DeployResponse,
@@ -150,10 +254,6 @@ def test_sequence(
 ) -> None:
     participants, winners, shuffled_winners = test_scenario
 
-    sp = algorand_client.client.algod.suggested_params()
-    sp.flat_fee = True
-    sp.fee = ((winners * cfg_vs.COMMIT_SINGLE_WINNER_OP_COST) // 700 + 2) * min_txn_fee
-
     commit_result = verifiable_shuffle_client.opt_in_commit(
         delay=1,
         participants=participants,
@@ -161,16 +261,14 @@ def test_sequence(
         transaction_parameters=TransactionParameters(
             signer=user_account.signer,
             sender=user_account.address,
-            suggested_params=sp,
-            foreign_apps=[opup_deployment.app.app_id],
+            suggested_params=suggested_params,
         ),
     )
 
     assert commit_result.confirmed_round
 
-    sp = algorand_client.client.algod.suggested_params()
-    sp.flat_fee = True
-    sp.fee = ((winners * cfg_vs.REVEAL_SINGLE_WINNER_OP_COST) // 700 + 3) * min_txn_fee
+    sp = copy.copy(suggested_params)
+    sp.fee = reveal_fee(winners)
 
     reveal_result = verifiable_shuffle_client.close_out_reveal(
         transaction_parameters=TransactionParameters(
@@ -185,68 +283,61 @@ def test_sequence(
     )
     reveal_outcome = reveal_result.return_value
 
-    assert (
-        base64.b32encode(bytes(reveal_outcome.commitment_tx_id)).decode().strip("=")
-        == commit_result.tx_id
+    # Transaction IDs are unpadded base32, 52 characters for 32 bytes.
+    assert bytes(reveal_outcome.commitment_tx_id) == base64.b32decode(
+        commit_result.tx_id + "===="
     )
     assert reveal_outcome.winners == shuffled_winners
 
 
+# Each case is accepted as is and rejected once the given axis is bumped by one.
+# Bumping #winners walks the frontier across the table rows. Bumping #participants checks the rows where the bound
+#  of cfg.MAX_PARTICIPANTS_BY_WINNERS is tight rather than capped by the 32-bit argument.
 @pytest.mark.parametrize(
     "test_scenario",
     [
-        (2**32 - 1, 4),
-        (2**16 - 1, 8),
-        (2**8 - 1, 16),
-        (80, 20),
-        (47, 25),
-        (35, 30),
+        (2**32 - 1, 4, "winners"),
+        (2**16 - 1, 8, "winners"),
+        (2**8 - 1, 16, "winners"),
+        (80, 20, "winners"),
+        (47, 25, "winners"),
+        (35, 30, "winners"),
+        (50859010, 5, "participants"),
+        (34, 31, "participants"),
+        (34, 32, "participants"),
+        (34, 33, "participants"),
     ],
 )
 def test_safety_bounds(
-    algorand_client: AlgorandClient,
+    suggested_params: SuggestedParams,
     verifiable_shuffle_client: VerifiableShuffleClient,
-    opup_deployment: DeployResponse,
     user_account: AddressAndSigner,
-    test_scenario: Tuple[int, int],
+    test_scenario: Tuple[int, int, Literal["participants", "winners"]],
 ) -> None:
-    participants, winners = test_scenario
-
-    sp = algorand_client.client.algod.suggested_params()
-    sp.flat_fee = True
-    sp.fee = (
-        (winners * cfg_vs.COMMIT_SINGLE_WINNER_OP_COST) // 700 + 2 + 1
-    ) * min_txn_fee
+    participants, winners, bumped = test_scenario
+    rejected_participants = (
+        participants + 1 if bumped == "participants" else participants
+    )
+    rejected_winners = winners + 1 if bumped == "winners" else winners
 
     with pytest.raises(LogicError, match=err.SAFE_SIZE):
         verifiable_shuffle_client.opt_in_commit(
             delay=1,
-            participants=participants,
-            winners=winners + 1,
+            participants=rejected_participants,
+            winners=rejected_winners,
             transaction_parameters=TransactionParameters(
                 signer=user_account.signer,
                 sender=user_account.address,
-                suggested_params=sp,
-                foreign_apps=[opup_deployment.app.app_id],
+                suggested_params=suggested_params,
             ),
         )
 
-    verifiable_shuffle_client.opt_in_commit(
-        delay=1,
-        participants=participants,
-        winners=winners,
-        transaction_parameters=TransactionParameters(
-            signer=user_account.signer,
-            sender=user_account.address,
-            suggested_params=sp,
-            foreign_apps=[opup_deployment.app.app_id],
-        ),
-    )
-
-    verifiable_shuffle_client.clear_state(
-        transaction_parameters=TransactionParameters(
-            signer=user_account.signer, sender=user_account.address
-        )
+    commit_and_clear(
+        verifiable_shuffle_client,
+        user_account,
+        suggested_params,
+        participants,
+        winners,
     )
 
 
@@ -259,32 +350,17 @@ def test_safety_bounds(
     ],
 )
 def test_special_case(
-    algorand_client: AlgorandClient,
+    suggested_params: SuggestedParams,
     verifiable_shuffle_client: VerifiableShuffleClient,
-    opup_deployment: DeployResponse,
     user_account: AddressAndSigner,
     test_scenario: Tuple[int, int],
 ) -> None:
     participants, winners = test_scenario
 
-    sp = algorand_client.client.algod.suggested_params()
-    sp.flat_fee = True
-    sp.fee = ((winners * cfg_vs.COMMIT_SINGLE_WINNER_OP_COST) // 700 + 2) * min_txn_fee
-
-    verifiable_shuffle_client.opt_in_commit(
-        delay=1,
-        participants=participants,
-        winners=winners,
-        transaction_parameters=TransactionParameters(
-            signer=user_account.signer,
-            sender=user_account.address,
-            suggested_params=sp,
-            foreign_apps=[opup_deployment.app.app_id],
-        ),
-    )
-
-    verifiable_shuffle_client.clear_state(
-        transaction_parameters=TransactionParameters(
-            signer=user_account.signer, sender=user_account.address
-        )
+    commit_and_clear(
+        verifiable_shuffle_client,
+        user_account,
+        suggested_params,
+        participants,
+        winners,
     )